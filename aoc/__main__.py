@@ -0,0 +1,118 @@
+import sys
+from argparse import REMAINDER, ArgumentParser, Namespace
+from contextlib import nullcontext
+from pathlib import Path
+from time import perf_counter
+
+from aoc.batch import iter_batch_results
+from aoc.dispatcher import UnknownDayError, get_available_days, iter_results, load_day, parse_day_arguments
+from aoc.profiling import profiling
+
+parser = ArgumentParser(prog="python -m aoc")
+subparsers = parser.add_subparsers(dest="command", required=True)
+run_parser = subparsers.add_parser("run")
+run_parser.add_argument(
+    "-p", "--profile",
+    action="store_true",
+)
+run_parser.add_argument(
+    "--profile-output",
+    type=Path,
+)
+run_parser.add_argument(
+    "day",
+)
+run_parser.add_argument(
+    "arguments",
+    nargs=REMAINDER,
+)
+batch_parser = subparsers.add_parser("batch")
+batch_parser.add_argument(
+    "-j", "--jobs",
+    type=int,
+)
+batch_parser.add_argument(
+    "-s", "--shard-size",
+    type=int,
+    default=1,
+)
+batch_parser.add_argument(
+    "day",
+)
+batch_parser.add_argument(
+    "arguments",
+    nargs=REMAINDER,
+)
+bench_parser = subparsers.add_parser("bench", add_help=False)
+bench_parser.add_argument(
+    "arguments",
+    nargs=REMAINDER,
+)
+subparsers.add_parser("list")
+
+
+def run(args: Namespace) -> int:
+    try:
+        module = load_day(args.day)
+    except UnknownDayError as e:
+        run_parser.error(str(e))
+    module.parser.prog = f"{run_parser.prog} {args.day}"
+    options, paths = parse_day_arguments(module, args.arguments)
+    exit_code = 0
+    profile_enabled = args.profile or args.profile_output is not None
+    with profiling(args.profile_output) if profile_enabled else nullcontext() as profile:
+        for path, result, error in iter_results(module, options, paths):
+            if error is not None:
+                print(f"{path}: {type(error).__name__}: {error}", file=sys.stderr)
+                exit_code = 1
+            elif len(paths) == 1:
+                print(result)
+            else:
+                print(f"{path}: {result}")
+    if profile is not None:
+        print(profile, file=sys.stderr)
+    return exit_code
+
+
+def batch(args: Namespace) -> int:
+    try:
+        module = load_day(args.day)
+    except UnknownDayError as e:
+        batch_parser.error(str(e))
+    module.parser.prog = f"{batch_parser.prog} {args.day}"
+    options, paths = parse_day_arguments(module, args.arguments)
+    exit_code = 0
+    start = perf_counter()
+    solve_time = 0.0
+    for result in iter_batch_results(args.day, options, paths, args.jobs, args.shard_size):
+        solve_time += result.elapsed
+        if result.error is not None:
+            print(f"{result.path}: {result.error}", file=sys.stderr)
+            exit_code = 1
+        else:
+            print(f"{result.path}: {result.result} ({result.elapsed * 1000:.2f}ms)", flush=True)
+    elapsed = perf_counter() - start
+    print(
+        f"Solved {len(paths)} files in {elapsed:.2f}s "
+        f"({len(paths) / elapsed:.1f} files/s, {solve_time:.2f}s total solve time)",
+        file=sys.stderr,
+    )
+    return exit_code
+
+
+def main(args: Namespace) -> int:
+    match args.command:
+        case "run":
+            return run(args)
+        case "batch":
+            return batch(args)
+        case "bench":
+            from aoc import bench
+            return bench.run(bench.parser.parse_args(args.arguments))
+        case _:
+            print("\n".join(get_available_days()))
+            return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(parser.parse_args()))
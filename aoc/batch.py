@@ -0,0 +1,52 @@
+from argparse import Namespace
+from collections.abc import Generator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from time import perf_counter
+
+from aoc.dispatcher import load_day, solve_file
+
+
+@dataclass
+class BatchResult:
+    path: str
+    result: int | str | None
+    elapsed: float
+    error: str | None = None
+
+
+def solve_shard(day: str, options: Namespace, paths: list[str]) -> list[BatchResult]:
+    module = load_day(day)
+    results: list[BatchResult] = []
+    for path in paths:
+        start = perf_counter()
+        try:
+            result = solve_file(module, options, path)
+        except Exception as e:
+            results.append(BatchResult(path, None, perf_counter() - start, f"{type(e).__name__}: {e}"))
+        else:
+            results.append(BatchResult(path, result, perf_counter() - start))
+    return results
+
+
+def get_shards(paths: list[str], shard_size: int) -> list[list[str]]:
+    if shard_size < 1:
+        raise ValueError("Shard size must be at least 1")
+    return [paths[i:i + shard_size] for i in range(0, len(paths), shard_size)]
+
+
+def iter_batch_results(
+    day: str,
+    options: Namespace,
+    paths: list[str],
+    max_workers: int | None = None,
+    shard_size: int = 1,
+) -> Generator[BatchResult]:
+    load_day(day)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(solve_shard, day, options, shard)
+            for shard in get_shards(paths, shard_size)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
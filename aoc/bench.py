@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+import json
+import sys
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from dataclasses import asdict, dataclass
+from importlib import import_module
+from math import log
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from aoc.generators import GENERATORS
+
+
+@dataclass
+class Benchmark:
+    day: str
+    sizes: tuple[int, ...]
+    options: tuple[str, ...] = ()
+
+
+@dataclass
+class Measurement:
+    day: str
+    size: int
+    wall_time: float
+    peak_memory: int
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    benchmark.day: benchmark for benchmark in [
+        Benchmark("day1", (1000, 10000, 100000)),
+        Benchmark("day2", (1000, 10000, 100000), ("-m", "possibility", "-r", "12", "-g", "13", "-b", "14")),
+        Benchmark("day3", (50, 100, 200), ("-m", "part-numbers")),
+        Benchmark("day4", (1000, 10000, 100000), ("-m", "total-value")),
+        Benchmark("day5", (10, 100, 1000)),
+        Benchmark("day6", (10, 100, 1000)),
+        Benchmark("day7", (1000, 5000, 20000)),
+        Benchmark("day8", (1000, 10000, 100000)),
+        Benchmark("day9", (1000, 10000, 50000)),
+        Benchmark("day10", (50, 100, 200)),
+        Benchmark("day11", (8, 12, 16)),
+        Benchmark("day13", (100, 1000, 10000)),
+        Benchmark("day14", (10, 20, 40), ("-c", "1000000000")),
+        Benchmark("day15", (1000, 5000, 20000), ("-m", "focusing-power")),
+        Benchmark("day16", (25, 50, 100)),
+        Benchmark("day17", (10, 20, 40)),
+        Benchmark("day18", (25, 50, 100)),
+        Benchmark("day19", (1000, 10000, 100000)),
+    ]
+}
+
+
+def measure(day: str, size: int, options: tuple[str, ...] = (), repeat: int = 3, seed: int = 0) -> Measurement:
+    module = import_module(f"{day}.run")
+    with TemporaryDirectory() as directory:
+        path = Path(directory, f"{day}-{size}.txt")
+        path.write_text(GENERATORS[day](size, Random(seed)))
+        wall_times: list[float] = []
+        for _ in range(repeat):
+            args = module.parser.parse_args([str(path), *options])
+            with args.data:
+                start = perf_counter()
+                module.solve(args)
+                wall_times.append(perf_counter() - start)
+        args = module.parser.parse_args([str(path), *options])
+        with args.data:
+            tracemalloc.start()
+            try:
+                module.solve(args)
+                _, peak_memory = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    return Measurement(day=day, size=size, wall_time=min(wall_times), peak_memory=peak_memory)
+
+
+def get_scaling_exponents(measurements: list[Measurement]) -> list[float | None]:
+    exponents: list[float | None] = [None]
+    for previous, current in zip(measurements, measurements[1:]):
+        if previous.wall_time and current.wall_time and previous.size != current.size:
+            exponents.append(
+                log(current.wall_time / previous.wall_time) / log(current.size / previous.size)
+            )
+        else:
+            exponents.append(None)
+    return exponents
+
+
+def find_regressions(
+    measurements: list[Measurement],
+    baseline: list[Measurement],
+    tolerance: float,
+) -> list[tuple[Measurement, Measurement]]:
+    baseline_index = {(measurement.day, measurement.size): measurement for measurement in baseline}
+    regressions: list[tuple[Measurement, Measurement]] = []
+    for measurement in measurements:
+        reference = baseline_index.get((measurement.day, measurement.size))
+        if reference is not None and measurement.wall_time > reference.wall_time * (1 + tolerance):
+            regressions.append((measurement, reference))
+    return regressions
+
+
+parser = ArgumentParser()
+parser.add_argument(
+    "days",
+    nargs="*",
+)
+parser.add_argument(
+    "-s", "--sizes",
+    type=int,
+    nargs="+",
+)
+parser.add_argument(
+    "-r", "--repeat",
+    type=int,
+    default=3,
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    default=0,
+)
+parser.add_argument(
+    "-o", "--output",
+    type=Path,
+)
+parser.add_argument(
+    "-b", "--baseline",
+    type=Path,
+)
+parser.add_argument(
+    "-t", "--tolerance",
+    type=float,
+    default=0.25,
+)
+
+
+def run(args: Namespace) -> int:
+    for day in args.days:
+        if day not in BENCHMARKS:
+            parser.error(f"No benchmark defined for {day}")
+    measurements: list[Measurement] = []
+    print(f"{'day':<6} {'size':>8} {'time (ms)':>12} {'peak (KiB)':>12} {'exponent':>9}")
+    for day in args.days or list(BENCHMARKS):
+        benchmark = BENCHMARKS[day]
+        day_measurements = [
+            measure(day, size, benchmark.options, args.repeat, args.seed)
+            for size in args.sizes or benchmark.sizes
+        ]
+        for measurement, exponent in zip(day_measurements, get_scaling_exponents(day_measurements)):
+            print(
+                f"{measurement.day:<6} {measurement.size:>8} {measurement.wall_time * 1000:>12.2f}"
+                f" {measurement.peak_memory / 1024:>12.1f} {'' if exponent is None else f'{exponent:.2f}':>9}"
+            )
+        measurements.extend(day_measurements)
+    if args.output:
+        args.output.write_text(json.dumps([asdict(measurement) for measurement in measurements], indent=2))
+    if args.baseline:
+        baseline = [Measurement(**item) for item in json.loads(args.baseline.read_text())]
+        regressions = find_regressions(measurements, baseline, args.tolerance)
+        for measurement, reference in regressions:
+            print(
+                f"Regression in {measurement.day} at size {measurement.size}: "
+                f"{measurement.wall_time * 1000:.2f}ms vs {reference.wall_time * 1000:.2f}ms",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(parser.parse_args()))
@@ -0,0 +1,59 @@
+import re
+from argparse import Namespace
+from collections.abc import Generator
+from copy import copy
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from types import ModuleType
+
+from aoc.profiling import phase
+
+DAY_PATTERN = re.compile(r"^day\d+$")
+
+
+class UnknownDayError(ValueError):
+    pass
+
+
+def get_available_days() -> list[str]:
+    root = Path(__file__).parent.parent
+    return sorted(
+        (path.parent.name for path in root.glob("day*/run.py")),
+        key=lambda day: int(day[3:]),
+    )
+
+
+def load_day(day: str) -> ModuleType:
+    if not DAY_PATTERN.match(day) or find_spec(day) is None or find_spec(f"{day}.run") is None:
+        raise UnknownDayError(f"No solver found for {day}")
+    return import_module(f"{day}.run")
+
+
+def parse_day_arguments(module: ModuleType, arguments: list[str]) -> tuple[Namespace, list[str]]:
+    options, extra_arguments = module.parser.parse_known_args(arguments)
+    options.data.close()
+    for argument in extra_arguments:
+        if argument.startswith("-"):
+            module.parser.error(f"unrecognized arguments: {argument}")
+    paths = [options.data.name, *extra_arguments]
+    del options.data
+    return options, paths
+
+
+def solve_file(module: ModuleType, options: Namespace, path: str) -> int | str | None:
+    args = copy(options)
+    with open(path) as args.data, phase("solve"):
+        return module.solve(args)
+
+
+def iter_results(
+    module: ModuleType,
+    options: Namespace,
+    paths: list[str],
+) -> Generator[tuple[str, int | str | None, Exception | None]]:
+    for path in paths:
+        try:
+            yield path, solve_file(module, options, path), None
+        except Exception as e:
+            yield path, None, e
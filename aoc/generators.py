@@ -0,0 +1,226 @@
+from collections.abc import Callable
+from random import Random
+from string import ascii_lowercase
+
+from day1.handler import ENGLISH_DIGITS
+
+HEX_DIGITS = "0123456789abcdef"
+
+
+def generate_day1(size: int, rng: Random) -> str:
+    words = list(ENGLISH_DIGITS)
+    lines: list[str] = []
+    for _ in range(size):
+        tokens = [str(rng.randint(0, 9))]
+        for _ in range(rng.randint(2, 8)):
+            match rng.randint(0, 2):
+                case 0:
+                    tokens.append(str(rng.randint(0, 9)))
+                case 1:
+                    tokens.append(rng.choice(words))
+                case _:
+                    tokens.append("".join(rng.choices(ascii_lowercase, k=rng.randint(1, 5))))
+        rng.shuffle(tokens)
+        lines.append("".join(tokens))
+    return "\n".join(lines)
+
+
+def generate_day2(size: int, rng: Random) -> str:
+    lines: list[str] = []
+    for game_id in range(1, size + 1):
+        rounds: list[str] = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], k=rng.randint(1, 3))
+            rounds.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game_id}: {'; '.join(rounds)}")
+    return "\n".join(lines)
+
+
+def generate_day3(size: int, rng: Random) -> str:
+    lines: list[str] = []
+    for _ in range(size):
+        line: list[str] = []
+        while len(line) < size:
+            roll = rng.random()
+            if roll < 0.12:
+                line.extend(str(rng.randint(1, 999)))
+            elif roll < 0.18:
+                line.append(rng.choice("*#+$/@=%&-"))
+            line.append(".")
+        lines.append("".join(line[:size]))
+    return "\n".join(lines)
+
+
+def generate_day4(size: int, rng: Random) -> str:
+    lines: list[str] = []
+    for card_id in range(1, size + 1):
+        winning_numbers = rng.sample(range(1, 100), k=10)
+        numbers = rng.sample(range(1, 100), k=25)
+        lines.append(
+            f"Card {card_id:>4}: {' '.join(f'{n:>2}' for n in winning_numbers)}"
+            f" | {' '.join(f'{n:>2}' for n in numbers)}"
+        )
+    return "\n".join(lines)
+
+
+def generate_day5(size: int, rng: Random) -> str:
+    categories = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+    seeds = [rng.randint(0, 10 ** 9) for _ in range(20)]
+    sections = [f"seeds: {' '.join(str(seed) for seed in seeds)}"]
+    for source, destination in zip(categories, categories[1:]):
+        lines = [f"{source}-to-{destination} map:"]
+        segment_length = 10 ** 9 // size
+        starts = [i * segment_length for i in range(size)]
+        destinations = list(starts)
+        rng.shuffle(destinations)
+        for source_start, destination_start in zip(starts, destinations):
+            lines.append(f"{destination_start} {source_start} {rng.randint(1, segment_length)}")
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections)
+
+
+def generate_day6(size: int, rng: Random) -> str:
+    times = [rng.randint(10, 100) for _ in range(size)]
+    distances = [rng.randint(1, time * time // 4 - 1) for time in times]
+    return (
+        f"Time:     {' '.join(f'{time:>4}' for time in times)}\n"
+        f"Distance: {' '.join(f'{distance:>4}' for distance in distances)}"
+    )
+
+
+def generate_day7(size: int, rng: Random) -> str:
+    return "\n".join(
+        f"{''.join(rng.choices('23456789TJQKA', k=5))} {rng.randint(1, 1000)}"
+        for _ in range(size)
+    )
+
+
+def generate_day8(size: int, rng: Random) -> str:
+    lines = ["".join(rng.choices("LR", k=50)), ""]
+    for prefix, start, end in (("B", "AAA", "ZZZ"), ("C", "CCA", "CCZ")):
+        keys = [start] + [f"{prefix}{i:06d}" for i in range(max(size // 2 - 2, 0))] + [end]
+        for i, key in enumerate(keys):
+            next_key = keys[(i + 1) % len(keys)]
+            lines.append(f"{key} = ({next_key}, {next_key})")
+    return "\n".join(lines)
+
+
+def generate_day9(size: int, rng: Random) -> str:
+    lines: list[str] = []
+    for _ in range(size):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 4))]
+        lines.append(
+            " ".join(
+                str(sum(c * x ** power for power, c in enumerate(coefficients)))
+                for x in range(21)
+            )
+        )
+    return "\n".join(lines)
+
+
+def generate_day10(size: int, rng: Random) -> str:
+    size = max(size, 2)
+    lines: list[str] = []
+    for y in range(size):
+        if y == 0:
+            lines.append("S" + "-" * (size - 2) + "7")
+        elif y == size - 1:
+            lines.append("L" + "-" * (size - 2) + "J")
+        else:
+            lines.append("|" + "".join(rng.choices(".|-LJ7F", k=size - 2)) + "|")
+    return "\n".join(lines)
+
+
+def generate_day11(size: int, rng: Random) -> str:
+    return "\n".join(
+        "".join("#" if rng.random() < 0.05 else "." for _ in range(size))
+        for _ in range(size)
+    )
+
+
+def generate_day13(size: int, rng: Random) -> str:
+    maps: list[str] = []
+    for _ in range(size):
+        width = rng.randint(5, 17)
+        half = [
+            "".join(rng.choices(".#", k=width))
+            for _ in range(rng.randint(2, 8))
+        ]
+        maps.append("\n".join(half + half[::-1]))
+    return "\n\n".join(maps)
+
+
+def generate_day14(size: int, rng: Random) -> str:
+    return "\n".join(
+        "".join(rng.choices(".O#", weights=(6, 2, 1), k=size))
+        for _ in range(size)
+    )
+
+
+def generate_day15(size: int, rng: Random) -> str:
+    steps: list[str] = []
+    for _ in range(size):
+        label = "".join(rng.choices(ascii_lowercase, k=rng.randint(2, 6)))
+        steps.append(f"{label}-" if rng.random() < 0.3 else f"{label}={rng.randint(1, 9)}")
+    return ",".join(steps)
+
+
+def generate_day16(size: int, rng: Random) -> str:
+    return "\n".join(
+        "".join(rng.choices(".|-/\\", weights=(20, 1, 1, 1, 1), k=size))
+        for _ in range(size)
+    )
+
+
+def generate_day17(size: int, rng: Random) -> str:
+    return "\n".join(
+        "".join(rng.choices("123456789", k=size))
+        for _ in range(size)
+    )
+
+
+def generate_day18(size: int, rng: Random) -> str:
+    return "\n".join(
+        f"{direction} {size} (#{''.join(rng.choices(HEX_DIGITS, k=6))})"
+        for direction in "RDLU"
+    )
+
+
+def generate_day19(size: int, rng: Random) -> str:
+    lines: list[str] = []
+    names = ["in"] + [f"w{letter}" for letter in ascii_lowercase[:9]]
+    for i, name in enumerate(names):
+        targets = names[i + 1:] + ["A", "R"]
+        rules = [
+            f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{rng.choice(targets)}"
+            for _ in range(rng.randint(1, 4))
+        ]
+        lines.append(f"{name}{{{','.join(rules)},{rng.choice(['A', 'R'])}}}")
+    lines.append("")
+    for _ in range(size):
+        lines.append(
+            "{" + ",".join(f"{param}={rng.randint(1, 4000)}" for param in "xmas") + "}"
+        )
+    return "\n".join(lines)
+
+
+GENERATORS: dict[str, Callable[[int, Random], str]] = {
+    "day1": generate_day1,
+    "day2": generate_day2,
+    "day3": generate_day3,
+    "day4": generate_day4,
+    "day5": generate_day5,
+    "day6": generate_day6,
+    "day7": generate_day7,
+    "day8": generate_day8,
+    "day9": generate_day9,
+    "day10": generate_day10,
+    "day11": generate_day11,
+    "day13": generate_day13,
+    "day14": generate_day14,
+    "day15": generate_day15,
+    "day16": generate_day16,
+    "day17": generate_day17,
+    "day18": generate_day18,
+    "day19": generate_day19,
+}
@@ -0,0 +1,96 @@
+from collections.abc import Iterable
+from enum import IntEnum
+
+from aoc.reader import MappedInput
+
+
+class Heading(IntEnum):
+    NORTH = 0
+    EAST = 1
+    SOUTH = 2
+    WEST = 3
+
+    @property
+    def complement(self) -> "Heading":
+        return Heading((self + 2) % 4)
+
+
+OFFSETS: tuple[tuple[int, int], ...] = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
+class Grid:
+    def __init__(self, width: int, height: int, cells: bytearray | None = None):
+        if cells is None:
+            cells = bytearray(width * height)
+        if len(cells) != width * height:
+            raise ValueError(f"Expected {width * height} cells, got {len(cells)}")
+        self.width = width
+        self.height = height
+        self.cells = cells
+        self.steps: tuple[int, ...] = (-width, 1, width, -1)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[bytes | bytearray | memoryview]) -> "Grid":
+        cells = bytearray()
+        width: int | None = None
+        height = 0
+        for row in rows:
+            if not len(row):
+                continue
+            if width is None:
+                width = len(row)
+            elif len(row) != width:
+                raise ValueError(f"Row {height} has length {len(row)}, expected {width}")
+            cells += row
+            height += 1
+        return cls(width or 0, height, cells)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "Grid":
+        return cls.from_rows(line.strip().encode() for line in lines)
+
+    @classmethod
+    def from_mapped_input(cls, input_data: MappedInput) -> "Grid":
+        return cls.from_rows(input_data.iter_lines())
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, coords: tuple[int, int]) -> int:
+        return self.cells[self.index(*coords)]
+
+    def __setitem__(self, coords: tuple[int, int], value: int):
+        self.cells[self.index(*coords)] = value
+
+    def __str__(self) -> str:
+        return "\n".join(
+            self.cells[row_start:row_start + self.width].decode()
+            for row_start in range(0, len(self.cells), self.width)
+        )
+
+    def index(self, x: int, y: int) -> int:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Position {(x, y)} is outside the grid")
+        return y * self.width + x
+
+    def coords(self, index: int) -> tuple[int, int]:
+        return index % self.width, index // self.width
+
+    def get_neighbour(self, index: int, heading: Heading | int) -> int | None:
+        match heading:
+            case Heading.NORTH:
+                if index < self.width:
+                    return None
+            case Heading.EAST:
+                if index % self.width == self.width - 1:
+                    return None
+            case Heading.SOUTH:
+                if index >= len(self.cells) - self.width:
+                    return None
+            case _:
+                if index % self.width == 0:
+                    return None
+        return index + self.steps[heading]
+
+    def find(self, value: int) -> int:
+        return self.cells.find(value)
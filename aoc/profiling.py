@@ -0,0 +1,102 @@
+from cProfile import Profile as CProfile
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class Profile:
+    phases: dict[str, float] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+    active_phases: list[tuple[str, float]] = field(default_factory=list)
+
+    def enter_phase(self, name: str):
+        now = perf_counter()
+        if self.active_phases:
+            self.pause_phase(now)
+        self.active_phases.append((name, now))
+
+    def exit_phase(self):
+        now = perf_counter()
+        self.pause_phase(now)
+        self.active_phases.pop()
+        if self.active_phases:
+            self.active_phases[-1] = (self.active_phases[-1][0], now)
+
+    def pause_phase(self, now: float):
+        name, start = self.active_phases[-1]
+        self.phases[name] = self.phases.get(name, 0.0) + now - start
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.phases.values())
+
+    def __str__(self) -> str:
+        total_time = self.total_time
+        lines = [f"{'phase':<24} {'time (ms)':>12} {'share':>7}"]
+        for name, elapsed in self.phases.items():
+            share = elapsed / total_time if total_time else 0.0
+            lines.append(f"{name:<24} {elapsed * 1000:>12.2f} {share:>7.1%}")
+        if self.counters:
+            lines.append(f"{'counter':<24} {'value':>12}")
+            for name, value in self.counters.items():
+                lines.append(f"{name:<24} {value:>12}")
+        return "\n".join(lines)
+
+
+_profile: Profile | None = None
+
+
+@contextmanager
+def profiling(output_path: str | Path | None = None) -> Generator[Profile]:
+    global _profile
+    profile = Profile()
+    call_profile = CProfile() if output_path is not None else None
+    try:
+        _profile = profile
+        if call_profile is not None:
+            call_profile.enable()
+        yield profile
+    finally:
+        if call_profile is not None:
+            call_profile.disable()
+            call_profile.dump_stats(output_path)
+        _profile = None
+
+
+@contextmanager
+def phase(name: str):
+    profile = _profile
+    if profile is None:
+        yield
+        return
+    profile.enter_phase(name)
+    try:
+        yield
+    finally:
+        profile.exit_phase()
+
+
+def iter_phase(name: str, iterable: Iterable[T]) -> Generator[T]:
+    if _profile is None:
+        yield from iterable
+        return
+    iterator = iter(iterable)
+    while True:
+        with phase(name):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def increment(counter: str, count: int = 1):
+    if _profile is not None:
+        _profile.counters[counter] = _profile.counters.get(counter, 0) + count
+
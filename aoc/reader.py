@@ -0,0 +1,65 @@
+import mmap
+from collections.abc import Generator
+from pathlib import Path
+
+TRAILING_WHITESPACE = b" \t\r"
+
+
+def iter_chunk_offsets(data: bytes | bytearray | mmap.mmap, chunk_size: int) -> Generator[tuple[int, int]]:
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    start = 0
+    while start < len(data):
+        end = data.find(b"\n", start + chunk_size - 1)
+        end = len(data) if end == -1 else end + 1
+        yield start, end
+        start = end
+
+
+class MappedInput:
+    def __init__(self, path: str | Path):
+        self.path = path
+        self._file = open(path, "rb")
+        self.data: mmap.mmap | bytes
+        try:
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.data = b""
+        self.view = memoryview(self.data)
+
+    def __enter__(self) -> "MappedInput":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def close(self):
+        self.view.release()
+        if isinstance(self.data, mmap.mmap):
+            try:
+                self.data.close()
+            except BufferError:
+                pass
+        self._file.close()
+
+    def iter_lines(self) -> Generator[memoryview]:
+        start = 0
+        size = len(self.data)
+        while start < size:
+            end = self.data.find(b"\n", start)
+            if end == -1:
+                end = size
+            stop = end
+            while stop > start and self.data[stop - 1] in TRAILING_WHITESPACE:
+                stop -= 1
+            yield self.view[start:stop]
+            start = end + 1
+
+    def get_chunk_offsets(self, chunk_size: int) -> list[tuple[int, int]]:
+        return list(iter_chunk_offsets(self.data, chunk_size))
+
+    def get_rows(self) -> list[memoryview]:
+        return [line for line in self.iter_lines() if len(line)]
@@ -0,0 +1,15 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from aoc.reader import MappedInput
+
+
+@contextmanager
+def mapped_input(content: str) -> Generator[MappedInput]:
+    with TemporaryDirectory() as directory:
+        path = Path(directory, "input.txt")
+        path.write_text(content)
+        with MappedInput(path) as input_data:
+            yield input_data
@@ -0,0 +1,272 @@
+from contextlib import redirect_stderr
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from .batch import get_shards, iter_batch_results
+from .bench import BENCHMARKS, Measurement, find_regressions, get_scaling_exponents, measure
+from .dispatcher import UnknownDayError, get_available_days, iter_results, load_day, parse_day_arguments
+from .grid import Grid, Heading
+from .profiling import increment, iter_phase, phase, profiling
+from .reader import iter_chunk_offsets
+from .testing import mapped_input
+
+
+class BenchTestCase(TestCase):
+    def test_measure_every_benchmark(self):
+        for day, benchmark in BENCHMARKS.items():
+            with self.subTest(day=day):
+                measurement = measure(day, 6, benchmark.options, repeat=1)
+                self.assertEqual(measurement.day, day)
+                self.assertEqual(measurement.size, 6)
+                self.assertGreater(measurement.wall_time, 0)
+                self.assertGreater(measurement.peak_memory, 0)
+
+    def test_get_scaling_exponents(self):
+        self.assertEqual(
+            get_scaling_exponents(
+                [
+                    Measurement(day="day1", size=10, wall_time=1.0, peak_memory=0),
+                    Measurement(day="day1", size=100, wall_time=10.0, peak_memory=0),
+                    Measurement(day="day1", size=1000, wall_time=1000.0, peak_memory=0),
+                ]
+            ),
+            [None, 1.0, 2.0]
+        )
+
+    def test_find_regressions(self):
+        baseline = [
+            Measurement(day="day1", size=10, wall_time=1.0, peak_memory=0),
+            Measurement(day="day1", size=100, wall_time=10.0, peak_memory=0),
+        ]
+        measurements = [
+            Measurement(day="day1", size=10, wall_time=1.1, peak_memory=0),
+            Measurement(day="day1", size=100, wall_time=13.0, peak_memory=0),
+            Measurement(day="day2", size=10, wall_time=50.0, peak_memory=0),
+        ]
+        self.assertEqual(
+            find_regressions(measurements, baseline, 0.25),
+            [(measurements[1], baseline[1])]
+        )
+
+
+class DispatcherTestCase(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.paths: list[str] = []
+        for i, content in enumerate(["1abc2\npqr3stu8vwx", "two1nine\neightwothree", "foo"]):
+            path = Path(self.directory.name, f"input{i}.txt")
+            path.write_text(content)
+            self.paths.append(str(path))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_available_days(self):
+        days = get_available_days()
+        self.assertEqual(days[:3], ["day1", "day2", "day3"])
+        self.assertNotIn("day12", days)
+
+    def test_load_day(self):
+        self.assertTrue(hasattr(load_day("day1"), "solve"))
+        for day in ("day12", "day99", "aoc"):
+            with self.assertRaises(UnknownDayError):
+                load_day(day)
+
+    def test_parse_day_arguments(self):
+        module = load_day("day1")
+        options, paths = parse_day_arguments(module, [self.paths[0], "-r", self.paths[1]])
+        self.assertTrue(options.replace)
+        self.assertFalse(hasattr(options, "data"))
+        self.assertEqual(paths, self.paths[:2])
+
+    def test_parse_day_arguments_rejects_conflicting_options(self):
+        module = load_day("day3")
+        with redirect_stderr(StringIO()):
+            for arguments in (["--backend", "bitmask", "--stream"], ["--backend", "bitmask", "-j", "2"]):
+                with self.assertRaises(SystemExit):
+                    parse_day_arguments(module, [*arguments, self.paths[0]])
+        options, _ = parse_day_arguments(module, ["--backend", "bitmask", self.paths[0]])
+        self.assertEqual(options.backend, "bitmask")
+
+    def test_iter_results(self):
+        module = load_day("day1")
+        options, paths = parse_day_arguments(module, ["-r", *self.paths])
+        results = list(iter_results(module, options, paths))
+        self.assertEqual(
+            [(path, result) for path, result, _ in results],
+            [(self.paths[0], 50), (self.paths[1], 112), (self.paths[2], None)]
+        )
+        self.assertIsNone(results[0][2])
+        self.assertIsInstance(results[2][2], ValueError)
+
+
+class BatchTestCase(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.paths: list[str] = []
+        for i, content in enumerate(["1abc2\npqr3stu8vwx", "two1nine\neightwothree", "foo", "7"]):
+            path = Path(self.directory.name, f"input{i}.txt")
+            path.write_text(content)
+            self.paths.append(str(path))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_shards(self):
+        self.assertEqual(get_shards(["a", "b", "c"], 2), [["a", "b"], ["c"]])
+        self.assertEqual(get_shards([], 2), [])
+        with self.assertRaises(ValueError):
+            get_shards(["a"], 0)
+
+    def test_iter_batch_results(self):
+        options, paths = parse_day_arguments(load_day("day1"), ["-r", *self.paths])
+        results = {
+            result.path: result
+            for result in iter_batch_results("day1", options, paths, max_workers=2, shard_size=3)
+        }
+        self.assertEqual(
+            {path: result.result for path, result in results.items()},
+            {self.paths[0]: 50, self.paths[1]: 112, self.paths[2]: None, self.paths[3]: 77}
+        )
+        self.assertIsNone(results[self.paths[0]].error)
+        self.assertTrue(results[self.paths[2]].error.startswith("NoDigitsInStringError"))
+        self.assertTrue(all(result.elapsed >= 0 for result in results.values()))
+
+
+class MappedInputTestCase(TestCase):
+    def test_iter_lines(self):
+        with mapped_input("ab\r\n\ncd\nef") as input_data:
+            self.assertEqual(len(input_data), 10)
+            self.assertEqual([bytes(line) for line in input_data.iter_lines()], [b"ab", b"", b"cd", b"ef"])
+        with mapped_input("ab\ncd\n") as input_data:
+            self.assertEqual([bytes(line) for line in input_data.iter_lines()], [b"ab", b"cd"])
+        with mapped_input("ab \t\r\n \ncd  \n") as input_data:
+            self.assertEqual([bytes(line) for line in input_data.iter_lines()], [b"ab", b"", b"cd"])
+
+    def test_get_rows(self):
+        with mapped_input("ab\n\ncd\n") as input_data:
+            rows = input_data.get_rows()
+            self.assertEqual([bytes(row) for row in rows], [b"ab", b"cd"])
+            self.assertIsInstance(rows[0], memoryview)
+
+    def test_empty_file(self):
+        with mapped_input("") as input_data:
+            self.assertEqual(len(input_data), 0)
+            self.assertEqual(list(input_data.iter_lines()), [])
+
+    def test_get_chunk_offsets(self):
+        with mapped_input("ab\ncde\nf\ngh") as input_data:
+            self.assertEqual(input_data.get_chunk_offsets(1), [(0, 3), (3, 7), (7, 9), (9, 11)])
+            self.assertEqual(input_data.get_chunk_offsets(4), [(0, 7), (7, 11)])
+            self.assertEqual(input_data.get_chunk_offsets(100), [(0, 11)])
+        with mapped_input("") as input_data:
+            self.assertEqual(input_data.get_chunk_offsets(4), [])
+        with self.assertRaises(ValueError):
+            list(iter_chunk_offsets(b"ab", 0))
+
+    def test_close(self):
+        with mapped_input("ab\ncd") as input_data:
+            rows = input_data.get_rows()
+        self.assertTrue(input_data._file.closed)
+        self.assertEqual(bytes(rows[1]), b"cd")
+
+
+class GridTestCase(TestCase):
+    def setUp(self):
+        self.grid = Grid.from_lines(["abc\n", "def\n", "\n"])
+
+    def test_dimensions(self):
+        self.assertEqual((self.grid.width, self.grid.height), (3, 2))
+        self.assertEqual(len(self.grid), 6)
+        self.assertEqual(str(self.grid), "abc\ndef")
+
+    def test_item_access(self):
+        self.assertEqual(self.grid[0, 0], ord("a"))
+        self.assertEqual(self.grid[2, 1], ord("f"))
+        self.grid[1, 1] = ord("x")
+        self.assertEqual(str(self.grid), "abc\ndxf")
+        with self.assertRaises(IndexError):
+            self.grid[3, 0]
+
+    def test_index_and_coords(self):
+        self.assertEqual(self.grid.index(2, 1), 5)
+        self.assertEqual(self.grid.coords(5), (2, 1))
+
+    def test_get_neighbour(self):
+        self.assertIsNone(self.grid.get_neighbour(0, Heading.NORTH))
+        self.assertIsNone(self.grid.get_neighbour(0, Heading.WEST))
+        self.assertEqual(self.grid.get_neighbour(0, Heading.EAST), 1)
+        self.assertEqual(self.grid.get_neighbour(0, Heading.SOUTH), 3)
+        self.assertIsNone(self.grid.get_neighbour(2, Heading.EAST))
+        self.assertIsNone(self.grid.get_neighbour(4, Heading.SOUTH))
+        self.assertEqual(self.grid.get_neighbour(4, Heading.NORTH), 1)
+        self.assertEqual(self.grid.get_neighbour(4, Heading.WEST), 3)
+
+    def test_heading_complement(self):
+        self.assertIs(Heading.NORTH.complement, Heading.SOUTH)
+        self.assertIs(Heading.WEST.complement, Heading.EAST)
+
+    def test_from_rows_rejects_ragged_rows(self):
+        with self.assertRaises(ValueError):
+            Grid.from_rows([b"ab", b"c"])
+
+    def test_from_mapped_input(self):
+        with mapped_input("ab\ncd\n") as input_data:
+            grid = Grid.from_mapped_input(input_data)
+        self.assertEqual(str(grid), "ab\ncd")
+        with mapped_input("ab \r\ncd\t\n") as input_data:
+            grid = Grid.from_mapped_input(input_data)
+        self.assertEqual(str(grid), "ab\ncd")
+
+
+class ProfilingTestCase(TestCase):
+    def test_phases_are_exclusive(self):
+        with profiling() as profile:
+            with phase("solve"):
+                with phase("parse"):
+                    pass
+                with phase("parse"):
+                    pass
+        self.assertEqual(list(profile.phases), ["solve", "parse"])
+        self.assertAlmostEqual(profile.total_time, sum(profile.phases.values()))
+        self.assertEqual(profile.active_phases, [])
+
+    def test_iter_phase(self):
+        lines = iter(["a", "b", "c"])
+        self.assertIs(next(iter_phase("parse", lines)), "a")
+        with profiling() as profile:
+            with phase("solve"):
+                items = []
+                for item in iter_phase("parse", lines):
+                    items.append(item)
+        self.assertEqual(items, ["b", "c"])
+        self.assertEqual(list(profile.phases), ["solve", "parse"])
+        self.assertEqual(profile.active_phases, [])
+
+    def test_increment(self):
+        increment("ignored")
+        with profiling() as profile:
+            increment("pushes")
+            increment("pushes", 4)
+        self.assertEqual(profile.counters, {"pushes": 5})
+        with profiling() as profile:
+            pass
+        self.assertEqual(profile.counters, {})
+
+    def test_solver_counters(self):
+        module = load_day("day17")
+        options, paths = parse_day_arguments(module, [__file__, "--compact"])
+        with TemporaryDirectory() as directory:
+            path = Path(directory, "input.txt")
+            path.write_text("123\n456\n789\n")
+            output_path = Path(directory, "profile.out")
+            expected_results = list(iter_results(module, options, [str(path)]))
+            with profiling(output_path) as profile:
+                results = list(iter_results(module, options, [str(path)]))
+            self.assertTrue(output_path.exists())
+        self.assertEqual(results, expected_results)
+        self.assertIn("solve", profile.phases)
+        self.assertIn("parse", profile.phases)
+        self.assertGreater(profile.counters["heap_pushes"], 0)
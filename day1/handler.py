@@ -1,3 +1,17 @@
+from collections import deque
+from collections.abc import Generator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from mmap import mmap
+from operator import itemgetter
+
+from aoc.reader import MappedInput, iter_chunk_offsets
+
+DIGITS = b"0123456789"
+NEWLINE = ord("\n")
+NON_DIGIT_BYTES = bytes(byte for byte in range(256) if byte not in DIGITS and byte != NEWLINE)
+CHUNK_SIZE = 1 << 24
+
 ENGLISH_DIGITS = {k: str(i) for i, k in enumerate([
     "zero",
     "one",
@@ -16,6 +30,79 @@ class NoDigitsInStringError(ValueError):
     pass
 
 
+@dataclass
+class Automaton:
+    transitions: list[dict[str, int]]
+    outputs: list[list[int]]
+
+    @classmethod
+    def from_patterns(cls, patterns: list[str]) -> "Automaton":
+        transitions: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                if char not in transitions[state]:
+                    transitions[state][char] = len(transitions)
+                    transitions.append({})
+                    outputs.append([])
+                state = transitions[state][char]
+            outputs[state].append(index)
+        fallbacks = [0] * len(transitions)
+        queue = deque(transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            children = dict(transitions[state])
+            for char, child in children.items():
+                fallbacks[child] = transitions[fallbacks[state]].get(char, 0)
+                outputs[child].extend(outputs[fallbacks[child]])
+            for char, target in transitions[fallbacks[state]].items():
+                transitions[state].setdefault(char, target)
+            queue.extend(children.values())
+        return cls(transitions, outputs)
+
+
+class DigitMatcher:
+    def __init__(self, words: dict[str, str] | None = None):
+        table = {str(i): str(i) for i in range(10)} | (ENGLISH_DIGITS if words is None else words)
+        self.words = list(table)
+        self.digits = list(table.values())
+        self.max_length = max(len(word) for word in self.words)
+        self.forward = Automaton.from_patterns(self.words)
+        self.reverse = Automaton.from_patterns([word[::-1] for word in self.words])
+
+    def find_first(self, val: str) -> str | None:
+        best: tuple[int, int] | None = None
+        transitions = self.forward.transitions
+        outputs = self.forward.outputs
+        state = 0
+        for idx, char in enumerate(val):
+            if best is not None and idx - self.max_length >= best[0]:
+                break
+            state = transitions[state].get(char, 0)
+            for index in outputs[state]:
+                candidate = (idx - len(self.words[index]) + 1, index)
+                if best is None or candidate < best:
+                    best = candidate
+        return None if best is None else self.digits[best[1]]
+
+    def find_last(self, val: str) -> str | None:
+        transitions = self.reverse.transitions
+        outputs = self.reverse.outputs
+        state = 0
+        for char in reversed(val):
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                return self.digits[min(outputs[state])]
+        return None
+
+    def handle(self, val: str) -> int:
+        first_digit = self.find_first(val)
+        if first_digit is None:
+            raise NoDigitsInStringError
+        return int(f"{first_digit}{self.find_last(val)}")
+
+
 def handle(val: str) -> int:
     digits = [char for char in val if char.isdigit()]
     try:
@@ -24,13 +111,53 @@ def handle(val: str) -> int:
         raise NoDigitsInStringError
 
 
+def iter_digit_lines(data: bytes | bytearray | mmap, chunk_size: int = CHUNK_SIZE) -> Generator[list[bytes]]:
+    for start, end in iter_chunk_offsets(data, chunk_size):
+        digit_lines = bytes(data[start:end]).translate(None, NON_DIGIT_BYTES).split(b"\n")
+        if data[end - 1] == NEWLINE:
+            digit_lines.pop()
+        yield digit_lines
+
+
+def get_digit_sum(digits: bytes) -> int:
+    return sum(value * digits.count(digit) for value, digit in enumerate(DIGITS))
+
+
+def handle_buffer(data: bytes | bytearray | mmap, chunk_size: int = CHUNK_SIZE) -> int:
+    result = 0
+    for digit_lines in iter_digit_lines(data, chunk_size):
+        try:
+            first_digits = bytes(map(itemgetter(0), digit_lines))
+            last_digits = bytes(map(itemgetter(-1), digit_lines))
+        except IndexError:
+            raise NoDigitsInStringError
+        result += 10 * get_digit_sum(first_digits) + get_digit_sum(last_digits)
+    return result
+
+
+def handle_chunk(path: str, start: int, end: int, replace: bool = False) -> int:
+    with MappedInput(path) as input_data:
+        chunk = input_data.data[start:end]
+    if not replace:
+        return handle_buffer(chunk)
+    return sum(handle_with_replacement(line) for line in chunk.decode().splitlines())
+
+
+def handle_file(
+    path: str,
+    replace: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    max_workers: int | None = None,
+) -> int:
+    with MappedInput(path) as input_data:
+        offsets = input_data.get_chunk_offsets(chunk_size)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(handle_chunk, path, start, end, replace) for start, end in offsets]
+        return sum(future.result() for future in futures)
+
+
 def handle_with_replacement(val: str) -> int:
-    forward_digits = [char for char in replace_named_digits(val) if char.isdigit()]
-    reverse_digits = [char for char in replace_named_digits(val, True) if char.isdigit()]
-    try:
-        return int(f"{forward_digits[0]}{reverse_digits[-1]}")
-    except IndexError:
-        raise NoDigitsInStringError
+    return _default_matcher.handle(val)
 
 
 def do_replacement_if_digit_found(val: str, idx: int) -> tuple[str, bool]:
@@ -56,3 +183,6 @@ def replace_named_digits(val: str, reverse: bool = False) -> str:
                 break
             idx += 1
     return val
+
+
+_default_matcher = DigitMatcher()
@@ -1,29 +1,53 @@
 #!/usr/bin/env python
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from day1.handler import handle, handle_with_replacement
+from aoc.profiling import iter_phase
+from aoc.reader import MappedInput
+from day1.handler import CHUNK_SIZE, handle, handle_buffer, handle_file, handle_with_replacement
 
 parser = ArgumentParser()
 parser.add_argument(
     "data",
     type=open,
 )
-parser.add_argument(
+mode_group = parser.add_mutually_exclusive_group()
+mode_group.add_argument(
     "-r", "--replace",
     action="store_true",
 )
+mode_group.add_argument(
+    "--mmap",
+    action="store_true",
+)
+parser.add_argument(
+    "-j", "--jobs",
+    type=int,
+)
+parser.add_argument(
+    "--chunk-size",
+    type=int,
+    default=CHUNK_SIZE,
+)
 
 
-if __name__ == "__main__":
-    args = parser.parse_args()
+def solve(args: Namespace) -> int:
+    if args.jobs is not None:
+        return handle_file(args.data.name, args.replace, args.chunk_size, args.jobs)
+    if args.mmap:
+        with MappedInput(args.data.name) as input_data:
+            return handle_buffer(input_data.data, args.chunk_size)
     result = 0
-    for line in args.data:
+    for line in iter_phase("parse", args.data):
         if args.replace:
             result += handle_with_replacement(line)
         else:
             result += handle(line)
-    print(result)
+    return result
+
+
+if __name__ == "__main__":
+    print(solve(parser.parse_args()))
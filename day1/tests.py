@@ -1,7 +1,17 @@
 from io import StringIO
 from unittest import TestCase
 
-from .handler import NoDigitsInStringError, handle, handle_with_replacement, replace_named_digits
+from aoc.testing import mapped_input
+
+from .handler import (
+    DigitMatcher,
+    NoDigitsInStringError,
+    handle,
+    handle_buffer,
+    handle_file,
+    handle_with_replacement,
+    replace_named_digits,
+)
 
 
 class HandlerTestCase(TestCase):
@@ -18,6 +28,32 @@ treb7uchet"""
         with self.assertRaises(NoDigitsInStringError):
             handle("foo")
 
+    def test_handle_buffer(self):
+        test_input = b"1abc2\npqr3stu8vwx\r\na1b2c3d4e5f\ntreb7uchet\n"
+        self.assertEqual(handle_buffer(test_input), 142)
+        self.assertEqual(handle_buffer(test_input.rstrip()), 142)
+        self.assertEqual(handle_buffer(test_input, chunk_size=1), 142)
+        self.assertEqual(handle_buffer(b""), 0)
+        with mapped_input(test_input.decode()) as input_data:
+            self.assertEqual(handle_buffer(input_data.data), 142)
+
+    def test_handle_file(self):
+        test_input = "1abc2\npqr3stu8vwx\na1b2c3d4e5f\ntreb7uchet\ntwo1nine\n"
+        with mapped_input(test_input) as input_data:
+            for chunk_size in (1, 8, 1000):
+                with self.subTest(chunk_size=chunk_size):
+                    self.assertEqual(handle_file(input_data.path, chunk_size=chunk_size, max_workers=2), 153)
+                    self.assertEqual(
+                        handle_file(input_data.path, replace=True, chunk_size=chunk_size, max_workers=2),
+                        171
+                    )
+
+    def test_handle_buffer_raises_error_when_a_line_contains_no_digits(self):
+        for test_input in [b"foo", b"1a2\nfoo\n", b"1a2\nfoo", b"foo\n1a2", b"1a2\n\n3"]:
+            with self.subTest(test_input=test_input):
+                with self.assertRaises(NoDigitsInStringError):
+                    handle_buffer(test_input)
+
     def test_handles_expected_input_with_replacement(self):
         test_input = """two1nine
 eightwothree
@@ -74,3 +110,29 @@ nineight
         ]
         actual = [handle_with_replacement(line) for line in StringIO(test_input)]
         self.assertEqual(expected, actual)
+
+
+class DigitMatcherTestCase(TestCase):
+    def test_overlapping_words(self):
+        matcher = DigitMatcher()
+        self.assertEqual(matcher.find_first("xtwone3four"), "2")
+        self.assertEqual(matcher.find_last("xtwone3four"), "4")
+        self.assertEqual(matcher.find_last("nineight"), "8")
+        self.assertIsNone(matcher.find_first("abc"))
+        self.assertIsNone(matcher.find_last("abc"))
+
+    def test_first_match_by_start_position(self):
+        matcher = DigitMatcher({"abcd": "1", "bc": "2"})
+        self.assertEqual(matcher.handle("xabcdx"), 12)
+        self.assertEqual(matcher.handle("bcabcd"), 22)
+
+    def test_custom_words(self):
+        matcher = DigitMatcher({"eins": "1", "zwei": "2", "drei": "3"})
+        self.assertEqual(matcher.handle("zweins"), 21)
+        self.assertEqual(matcher.handle("xdrei7one"), 37)
+        with self.assertRaises(NoDigitsInStringError):
+            matcher.handle("one")
+
+    def test_literal_digits_only(self):
+        matcher = DigitMatcher({})
+        self.assertEqual(matcher.handle("one2three4"), 24)
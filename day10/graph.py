@@ -3,6 +3,17 @@ from enum import IntEnum, auto
 from functools import cached_property
 from itertools import chain
 
+from aoc.grid import Grid, Heading
+
+PIPE_HEADINGS: dict[int, tuple[Heading, Heading]] = {
+    ord("|"): (Heading.NORTH, Heading.SOUTH),
+    ord("-"): (Heading.EAST, Heading.WEST),
+    ord("L"): (Heading.NORTH, Heading.EAST),
+    ord("J"): (Heading.NORTH, Heading.WEST),
+    ord("7"): (Heading.SOUTH, Heading.WEST),
+    ord("F"): (Heading.SOUTH, Heading.EAST),
+}
+
 
 class Orientation(IntEnum):
     NORTH_SOUTH = auto()
@@ -251,3 +262,34 @@ class Graph:
         )
         self.nodes[self.start_pos[1]][self.start_pos[0]] = start_node
         return start_node
+
+
+def get_loop_length(grid: Grid, start_symbol: int = ord("S")) -> int:
+    start_index = grid.find(start_symbol)
+    if start_index == -1:
+        raise ValueError("No start position found")
+    start_headings: list[Heading] = []
+    for heading in Heading:
+        adjacent_index = grid.get_neighbour(start_index, heading)
+        if adjacent_index is not None and heading.complement in PIPE_HEADINGS.get(grid.cells[adjacent_index], ()):
+            start_headings.append(heading)
+    assert len(start_headings) == 2
+    index = start_index
+    heading = start_headings[0]
+    step_count = 0
+    while True:
+        next_index = grid.get_neighbour(index, heading)
+        if next_index is None:
+            raise RuntimeError("Trail unexpectedly cold")
+        index = next_index
+        step_count += 1
+        if index == start_index:
+            return step_count
+        headings = PIPE_HEADINGS.get(grid.cells[index], ())
+        if heading.complement not in headings:
+            raise RuntimeError("Next node does not link back to this node")
+        heading = headings[0] if headings[1] is heading.complement else headings[1]
+
+
+def get_steps_to_farthest_position_on_grid(grid: Grid) -> int:
+    return get_loop_length(grid) // 2
@@ -1,7 +1,20 @@
 from io import TextIOBase
 
+from aoc.reader import MappedInput
+
 from .graph import Direction, Graph, Node
 
+PIPE_DIRECTIONS: dict[int, tuple[Direction, Direction]] = {
+    ord("|"): (Direction.NORTH, Direction.SOUTH),
+    ord("-"): (Direction.EAST, Direction.WEST),
+    ord("L"): (Direction.NORTH, Direction.EAST),
+    ord("J"): (Direction.NORTH, Direction.WEST),
+    ord("7"): (Direction.SOUTH, Direction.WEST),
+    ord("F"): (Direction.SOUTH, Direction.EAST),
+}
+GROUND = ord(".")
+START = ord("S")
+
 
 def get_graph_from_input_data(input_data: TextIOBase) -> Graph:
     start_pos: tuple[int, int] | None = None
@@ -32,3 +45,23 @@ def get_graph_from_input_data(input_data: TextIOBase) -> Graph:
                     raise ValueError(f"Unexpected symbol: {char}")
         nodes.append(node_row)
     return Graph(nodes, start_pos)
+
+
+def get_graph_from_mapped_input(input_data: MappedInput) -> Graph:
+    start_pos: tuple[int, int] | None = None
+    nodes: list[list[Node | None]] = []
+    for y_pos, line in enumerate(input_data.get_rows()):
+        node_row: list[Node | None] = []
+        for x_pos, char in enumerate(line):
+            if char in PIPE_DIRECTIONS:
+                node_row.append(Node(x_pos, y_pos, PIPE_DIRECTIONS[char]))
+            elif char == GROUND:
+                node_row.append(None)
+            elif char == START:
+                assert start_pos is None
+                start_pos = (x_pos, y_pos)
+                node_row.append(None)
+            else:
+                raise ValueError(f"Unexpected symbol: {chr(char)}")
+        nodes.append(node_row)
+    return Graph(nodes, start_pos)
@@ -1,12 +1,16 @@
 #!/usr/bin/env python
 
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from day10.parser import get_graph_from_input_data
+from aoc.grid import Grid
+from aoc.profiling import phase
+from aoc.reader import MappedInput
+from day10.graph import get_steps_to_farthest_position_on_grid
+from day10.parser import get_graph_from_input_data, get_graph_from_mapped_input
 
 
 parser = ArgumentParser()
@@ -14,8 +18,36 @@ parser.add_argument(
     "data",
     type=open,
 )
+parser.add_argument(
+    "--mmap",
+    action="store_true",
+)
+parser.add_argument(
+    "--compact",
+    action="store_true",
+)
+
+
+def get_grid(args: Namespace) -> Grid:
+    if args.mmap:
+        with MappedInput(args.data.name) as input_data:
+            return Grid.from_mapped_input(input_data)
+    return Grid.from_lines(args.data)
+
+
+def solve(args: Namespace) -> int:
+    if args.compact:
+        with phase("parse"):
+            grid = get_grid(args)
+        return get_steps_to_farthest_position_on_grid(grid)
+    with phase("parse"):
+        if args.mmap:
+            with MappedInput(args.data.name) as input_data:
+                graph = get_graph_from_mapped_input(input_data)
+        else:
+            graph = get_graph_from_input_data(args.data)
+    return graph.get_steps_to_farthest_position()
+
 
 if __name__ == "__main__":
-    args = parser.parse_args()
-    graph = get_graph_from_input_data(args.data)
-    print(graph.get_steps_to_farthest_position())
+    print(solve(parser.parse_args()))
@@ -1,8 +1,11 @@
 from io import StringIO
 from unittest import TestCase
 
-from .graph import Direction, Orientation, Section
-from .parser import get_graph_from_input_data
+from aoc.grid import Grid
+from aoc.testing import mapped_input
+
+from .graph import Direction, Orientation, Section, get_steps_to_farthest_position_on_grid
+from .parser import get_graph_from_input_data, get_graph_from_mapped_input
 
 
 class DirectionTestCase(TestCase):
@@ -61,6 +64,22 @@ LJ.LJ""")
         self.assertEqual(len(graph.nodes[0]), 5)
         self.assertCountEqual(graph.start_node.directions, (Direction.WEST, Direction.SOUTH))
 
+    def test_get_graph_from_mapped_input(self):
+        input_data = """7-F7-
+.FJ|7
+SJLL7
+|F--J
+LJ.LJ"""
+        with mapped_input(input_data) as mapped_input_data:
+            graph = get_graph_from_mapped_input(mapped_input_data)
+        expected = get_graph_from_input_data(StringIO(input_data))
+        self.assertEqual(graph.start_pos, (0, 2))
+        self.assertEqual(
+            [[node and node.directions for node in row] for row in graph.nodes],
+            [[node and node.directions for node in row] for row in expected.nodes]
+        )
+        self.assertEqual(graph.get_steps_to_farthest_position(), 8)
+
 
 class GraphTestCase(TestCase):
     def test_get_steps_to_start(self):
@@ -108,6 +127,20 @@ LJ.LJ""")
         graph = get_graph_from_input_data(input_data)
         self.assertEqual(graph.get_steps_to_farthest_position(), 8)
 
+    def test_get_steps_to_farthest_position_on_grid(self):
+        grid = Grid.from_lines(StringIO("""-L|F7
+7S-7|
+L|7||
+-L-J|
+L|-JF"""))
+        self.assertEqual(get_steps_to_farthest_position_on_grid(grid), 4)
+        grid = Grid.from_lines(StringIO("""7-F7-
+-FJ|7
+SJLL7
+|F--J
+LJ.LJ"""))
+        self.assertEqual(get_steps_to_farthest_position_on_grid(grid), 8)
+
     def test_loop_node_tracking(self):
         input_data = StringIO("""-L|F7
 7S-7|
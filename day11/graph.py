@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from math import ceil
 
+from aoc.grid import Grid
+
 
 class Node:
     def __init__(self, x: int, y: int):
@@ -57,3 +59,41 @@ class Graph:
                     key.sort(key=lambda node: (node.x, node.y))
                     pair_distances[(key[0], key[1])] = distance
         return sum(pair_distances.values())
+
+
+def get_expanded_positions(occupied: list[bool], weight_coefficient: int) -> list[int]:
+    positions: list[int] = []
+    position = 0
+    for is_occupied in occupied:
+        positions.append(position)
+        position += 1 if is_occupied else weight_coefficient
+    return positions
+
+
+def get_sum_of_pairwise_distances(positions: list[int]) -> int:
+    positions = sorted(positions)
+    total = 0
+    running_sum = 0
+    for i, position in enumerate(positions):
+        total += position * i - running_sum
+        running_sum += position
+    return total
+
+
+def get_sum_of_distances_on_grid(grid: Grid, weight_coefficient: int = 2, target: int = ord("#")) -> int:
+    targets: list[tuple[int, int]] = []
+    index = grid.cells.find(target)
+    while index != -1:
+        targets.append(grid.coords(index))
+        index = grid.cells.find(target, index + 1)
+    occupied_columns = [False] * grid.width
+    occupied_rows = [False] * grid.height
+    for x, y in targets:
+        occupied_columns[x] = True
+        occupied_rows[y] = True
+    column_positions = get_expanded_positions(occupied_columns, weight_coefficient)
+    row_positions = get_expanded_positions(occupied_rows, weight_coefficient)
+    return (
+        get_sum_of_pairwise_distances([column_positions[x] for x, _ in targets])
+        + get_sum_of_pairwise_distances([row_positions[y] for _, y in targets])
+    )
@@ -1,14 +1,21 @@
+from collections.abc import Sequence
 from io import TextIOBase
 
+from aoc.reader import MappedInput
+
 from .graph import Graph, Node
 
 
-def is_multiple_weight(x: int, y: int, grid: list[list[str]]) -> bool:
-    return all(row[x] == "." for row in grid) or all(item == "." for item in grid[y])
+def is_multiple_weight(x: int, y: int, grid: Sequence[Sequence[str | int]], empty: str | int = ".") -> bool:
+    return all(row[x] == empty for row in grid) or all(item == empty for item in grid[y])
 
 
-def get_graph_from_input_data(input_data: TextIOBase, weight_coefficient: int = 2) -> Graph:
-    grid = [list(line.strip()) for line in input_data]
+def get_graph_from_grid(
+    grid: Sequence[Sequence[str | int]],
+    weight_coefficient: int = 2,
+    galaxy: str | int = "#",
+    empty: str | int = ".",
+) -> Graph:
     width = len(grid[0])
     height = len(grid)
     graph = Graph()
@@ -17,9 +24,9 @@ def get_graph_from_input_data(input_data: TextIOBase, weight_coefficient: int =
         for x_index in range(width):
             node = nodes[y_index][x_index]
             graph.nodes.add(node)
-            if grid[y_index][x_index] == "#":
+            if grid[y_index][x_index] == galaxy:
                 graph.target_nodes.append(node)
-            weight = weight_coefficient if is_multiple_weight(x_index, y_index, grid) else 1
+            weight = weight_coefficient if is_multiple_weight(x_index, y_index, grid, empty) else 1
             for offset in (1, -1):
                 x_offset = x_index + offset
                 y_offset = y_index + offset
@@ -28,3 +35,11 @@ def get_graph_from_input_data(input_data: TextIOBase, weight_coefficient: int =
                 if 0 <= y_offset < height:
                     nodes[y_offset][x_index].connect_to(node, weight)
     return graph
+
+
+def get_graph_from_input_data(input_data: TextIOBase, weight_coefficient: int = 2) -> Graph:
+    return get_graph_from_grid([list(line.strip()) for line in input_data], weight_coefficient)
+
+
+def get_graph_from_mapped_input(input_data: MappedInput, weight_coefficient: int = 2) -> Graph:
+    return get_graph_from_grid(input_data.get_rows(), weight_coefficient, ord("#"), ord("."))
@@ -1,13 +1,16 @@
 #!/usr/bin/env python
 
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from day11.graph import Node
-from day11.parser import get_graph_from_input_data
+from aoc.grid import Grid
+from aoc.profiling import phase
+from aoc.reader import MappedInput
+from day11.graph import get_sum_of_distances_on_grid
+from day11.parser import get_graph_from_input_data, get_graph_from_mapped_input
 
 
 parser = ArgumentParser()
@@ -20,9 +23,36 @@ parser.add_argument(
     type=int,
     default=2,
 )
+parser.add_argument(
+    "--mmap",
+    action="store_true",
+)
+parser.add_argument(
+    "--compact",
+    action="store_true",
+)
 
-if __name__ == "__main__":
-    args = parser.parse_args()
-    graph = get_graph_from_input_data(args.data, args.weight)
-    print(graph.get_sum_of_distances_between_all_targets())
 
+def get_grid(args: Namespace) -> Grid:
+    if args.mmap:
+        with MappedInput(args.data.name) as input_data:
+            return Grid.from_mapped_input(input_data)
+    return Grid.from_lines(args.data)
+
+
+def solve(args: Namespace) -> int:
+    if args.compact:
+        with phase("parse"):
+            grid = get_grid(args)
+        return get_sum_of_distances_on_grid(grid, args.weight)
+    with phase("parse"):
+        if args.mmap:
+            with MappedInput(args.data.name) as input_data:
+                graph = get_graph_from_mapped_input(input_data, args.weight)
+        else:
+            graph = get_graph_from_input_data(args.data, args.weight)
+    return graph.get_sum_of_distances_between_all_targets()
+
+
+if __name__ == "__main__":
+    print(solve(parser.parse_args()))
@@ -1,7 +1,11 @@
 from io import StringIO
 from unittest import TestCase
 
-from .parser import get_graph_from_input_data
+from aoc.grid import Grid
+from aoc.testing import mapped_input
+
+from .graph import get_sum_of_distances_on_grid
+from .parser import get_graph_from_input_data, get_graph_from_mapped_input
 
 
 class GraphTestCase(TestCase):
@@ -39,3 +43,36 @@ class GraphTestCase(TestCase):
 
     def test_get_sum_of_distances(self):
         self.assertEqual(self.graph.get_sum_of_distances_between_all_targets(), 374)
+
+    def test_get_sum_of_distances_on_grid(self):
+        grid = Grid.from_lines(StringIO("""...#......
+.......#..
+#.........
+..........
+......#...
+.#........
+.........#
+..........
+.......#..
+#...#....."""))
+        self.assertEqual(get_sum_of_distances_on_grid(grid), 374)
+        self.assertEqual(get_sum_of_distances_on_grid(grid, 10), 1030)
+        self.assertEqual(get_sum_of_distances_on_grid(grid, 100), 8410)
+
+    def test_get_graph_from_mapped_input(self):
+        with mapped_input("""...#......
+.......#..
+#.........
+..........
+......#...
+.#........
+.........#
+..........
+.......#..
+#...#.....""") as input_data:
+            graph = get_graph_from_mapped_input(input_data)
+        self.assertEqual(
+            [(node.x, node.y) for node in graph.target_nodes],
+            [(node.x, node.y) for node in self.graph.target_nodes]
+        )
+        self.assertEqual(graph.get_sum_of_distances_between_all_targets(), 374)
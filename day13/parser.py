@@ -1,8 +1,12 @@
 from collections.abc import Generator
 from io import TextIOBase
 
+from aoc.reader import MappedInput
+
 from .maps import Map, TerrainType
 
+TERRAIN_TYPES = {ord(terrain_type): terrain_type for terrain_type in TerrainType}
+
 
 def iter_maps_from_input(input_data: TextIOBase) -> Generator[Map]:
     current_map: list[list[TerrainType]] = []
@@ -14,3 +18,17 @@ def iter_maps_from_input(input_data: TextIOBase) -> Generator[Map]:
             yield Map(current_map)
             current_map = []
     yield Map(current_map)
+
+
+def iter_maps_from_mapped_input(input_data: MappedInput) -> Generator[Map]:
+    current_map: list[list[TerrainType]] = []
+    for line in input_data.iter_lines():
+        if line:
+            try:
+                current_map.append([TERRAIN_TYPES[c] for c in line])
+            except KeyError as e:
+                raise ValueError(f"{chr(e.args[0])!r} is not a valid {TerrainType.__name__}") from None
+        else:
+            yield Map(current_map)
+            current_map = []
+    yield Map(current_map)
@@ -1,13 +1,16 @@
 #!/usr/bin/env python
 
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
+from collections.abc import Iterable
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from day13.parser import iter_maps_from_input
-from day13.maps import Orientation
+from aoc.profiling import iter_phase
+from aoc.reader import MappedInput
+from day13.parser import iter_maps_from_input, iter_maps_from_mapped_input
+from day13.maps import Map, Orientation
 
 
 parser = ArgumentParser()
@@ -20,14 +23,30 @@ parser.add_argument(
     type=int,
     default=0,
 )
+parser.add_argument(
+    "--mmap",
+    action="store_true",
+)
 
-if __name__ == "__main__":
-    args = parser.parse_args()
+
+def get_summary(maps: Iterable[Map], difference_count: int) -> int:
     result = 0
-    for map in iter_maps_from_input(args.data):
-        orientation, index = map.find_axis_of_reflection(args.difference_count)
+    for map in maps:
+        orientation, index = map.find_axis_of_reflection(difference_count)
         if orientation is Orientation.VERTICAL:
             result += 100 * (index + 1)
         else:
             result += index + 1
-    print(result)
+    return result
+
+
+def solve(args: Namespace) -> int:
+    if args.mmap:
+        with MappedInput(args.data.name) as input_data:
+            maps = iter_phase("parse", iter_maps_from_mapped_input(input_data))
+            return get_summary(maps, args.difference_count)
+    return get_summary(iter_phase("parse", iter_maps_from_input(args.data)), args.difference_count)
+
+
+if __name__ == "__main__":
+    print(solve(parser.parse_args()))
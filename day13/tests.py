@@ -1,8 +1,10 @@
 from io import StringIO
 from unittest import TestCase
 
+from aoc.testing import mapped_input
+
 from .maps import Map, Orientation, TerrainType
-from .parser import iter_maps_from_input
+from .parser import iter_maps_from_input, iter_maps_from_mapped_input
 
 
 class MapTestCase(TestCase):
@@ -264,3 +266,29 @@ class ParserTestCase(TestCase):
         self.assertEqual(maps[1].height, 13)
         self.assertEqual(maps[2].width, 13)
         self.assertEqual(maps[2].height, 15)
+
+    def test_mapped_input_parser(self):
+        input_data = """#.##..##.
+..#.##.#.
+##......#
+##......#
+..#.##.#.
+..##..##.
+#.#.##.#.
+
+#...##..#
+#....#..#
+..##..###
+#####.##.
+#####.##.
+..##..###
+#....#..#
+"""
+        with mapped_input(input_data) as mapped_input_data:
+            maps = list(iter_maps_from_mapped_input(mapped_input_data))
+        self.assertEqual(maps, list(iter_maps_from_input(StringIO(input_data))))
+        self.assertEqual(len(maps), 2)
+        with mapped_input("#.x\n") as mapped_input_data:
+            with self.assertRaises(ValueError):
+                list(iter_maps_from_mapped_input(mapped_input_data))
+        self.assertEqual(maps[1].find_axis_of_reflection(), (Orientation.VERTICAL, 3))
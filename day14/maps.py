@@ -3,6 +3,8 @@ from dataclasses import dataclass
 from enum import Enum, StrEnum, auto
 from itertools import chain
 
+from aoc.profiling import increment
+
 
 class Direction(Enum):
     NORTH = auto()
@@ -88,6 +90,7 @@ class Map:
 
     def run_cycles(self, cycle_count: int):
         patterns: dict[int, int] = {}
+        i = 0
         for i in range(1, cycle_count + 1):
             self.run_cycle()
             current_hash = self.get_current_hash()
@@ -95,6 +98,7 @@ class Map:
                 patterns[current_hash] = i
             elif (cycle_count - patterns[current_hash]) % (i - patterns[current_hash]) == 0:
                 break
+        increment("cycles", i)
 
     def get_total_load(self) -> int:
         load = 0
@@ -1,7 +1,22 @@
 from io import TextIOBase
 
+from aoc.reader import MappedInput
+
 from .maps import Map, ObstacleType
 
+OBSTACLE_TYPES: dict[int, ObstacleType | None] = {
+    ord("."): None,
+    **{ord(obstacle_type): obstacle_type for obstacle_type in ObstacleType},
+}
+
 
 def get_map_from_input_data(input_data: TextIOBase) -> Map:
     return Map([[None if c == "." else ObstacleType(c) for c in line.strip()] for line in input_data])
+
+
+def get_map_from_mapped_input(input_data: MappedInput) -> Map:
+    try:
+        rows = [[OBSTACLE_TYPES[c] for c in line] for line in input_data.get_rows()]
+    except KeyError as e:
+        raise ValueError(f"{chr(e.args[0])!r} is not a valid {ObstacleType.__name__}") from None
+    return Map(rows)
@@ -1,12 +1,14 @@
 #!/usr/bin/env python
 
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from day14.parser import get_map_from_input_data
+from aoc.profiling import phase
+from aoc.reader import MappedInput
+from day14.parser import get_map_from_input_data, get_map_from_mapped_input
 
 
 parser = ArgumentParser()
@@ -19,12 +21,25 @@ parser.add_argument(
     type=int,
     default=0,
 )
+parser.add_argument(
+    "--mmap",
+    action="store_true",
+)
 
-if __name__ == "__main__":
-    args = parser.parse_args()
-    map = get_map_from_input_data(args.data)
+
+def solve(args: Namespace) -> int:
+    with phase("parse"):
+        if args.mmap:
+            with MappedInput(args.data.name) as input_data:
+                map = get_map_from_mapped_input(input_data)
+        else:
+            map = get_map_from_input_data(args.data)
     if args.cycles:
         map.run_cycles(args.cycles)
     else:
         map.shift_obstacles()
-    print(map.get_total_load())
+    return map.get_total_load()
+
+
+if __name__ == "__main__":
+    print(solve(parser.parse_args()))
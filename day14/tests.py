@@ -2,8 +2,10 @@ from copy import deepcopy
 from io import StringIO
 from unittest import TestCase
 
+from aoc.testing import mapped_input
+
 from .maps import Map, ObstacleType
-from .parser import get_map_from_input_data
+from .parser import get_map_from_input_data, get_map_from_mapped_input
 
 
 class ParserTestCase(TestCase):
@@ -52,6 +54,23 @@ O.#..O.#.#
             ]
         )
 
+    def test_get_map_from_mapped_input(self):
+        map_data = """O....#....
+O.OO#....#
+.....##...
+OO.#O....O
+.O.....O#.
+O.#..O.#.#
+..O..#O..O
+.......O..
+#....###..
+#OO..#...."""
+        with mapped_input(map_data) as input_data:
+            self.assertEqual(get_map_from_mapped_input(input_data), get_map_from_input_data(StringIO(map_data)))
+        with mapped_input("O.x\n") as input_data:
+            with self.assertRaises(ValueError):
+                get_map_from_mapped_input(input_data)
+
 
 class MapTestCase(TestCase):
     def test_shift_obstacles(self):
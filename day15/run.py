@@ -1,11 +1,12 @@
 #!/usr/bin/env python
 
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+from aoc.profiling import phase
 from day15.hashing import get_hash
 from day15.orchestration import BoxOrchestrator
 from day15.parser import get_values_from_input_data
@@ -21,13 +22,17 @@ parser.add_argument(
     choices=["hash-sum", "focusing-power"]
 )
 
-if __name__ == "__main__":
-    args = parser.parse_args()
-    steps = get_values_from_input_data(args.data)
+
+def solve(args: Namespace) -> int:
+    with phase("parse"):
+        steps = get_values_from_input_data(args.data)
     if args.mode == "hash-sum":
-        print(sum(get_hash(value) for value in steps))
-    else:
-        orchestrator = BoxOrchestrator()
-        for step in steps:
-            orchestrator.handle_step(step)
-        print(orchestrator.get_focal_power())
+        return sum(get_hash(value) for value in steps)
+    orchestrator = BoxOrchestrator()
+    for step in steps:
+        orchestrator.handle_step(step)
+    return orchestrator.get_focal_power()
+
+
+if __name__ == "__main__":
+    print(solve(parser.parse_args()))
@@ -1,6 +1,17 @@
 from dataclasses import dataclass, field
 from enum import Enum, auto
 
+from aoc.grid import Grid, Heading
+from aoc.profiling import increment
+
+HEADING_TRANSITIONS: dict[int, tuple[tuple[Heading, ...], ...]] = {
+    ord("."): ((Heading.NORTH,), (Heading.EAST,), (Heading.SOUTH,), (Heading.WEST,)),
+    ord("|"): ((Heading.NORTH,), (Heading.NORTH, Heading.SOUTH), (Heading.SOUTH,), (Heading.NORTH, Heading.SOUTH)),
+    ord("-"): ((Heading.EAST, Heading.WEST), (Heading.EAST,), (Heading.EAST, Heading.WEST), (Heading.WEST,)),
+    ord("/"): ((Heading.EAST,), (Heading.NORTH,), (Heading.WEST,), (Heading.SOUTH,)),
+    ord("\\"): ((Heading.WEST,), (Heading.SOUTH,), (Heading.EAST,), (Heading.NORTH,)),
+}
+
 
 class Direction(Enum):
     NORTH = auto()
@@ -113,7 +124,9 @@ class Graph:
                     visited_nodes_and_directions.add((node, direction))
                     next_nodes_and_directions.extend(node.get_linked_nodes(direction))
             current_nodes_and_directions = next_nodes_and_directions
-        return set(node for node, _ in visited_nodes_and_directions)
+        visited_nodes = set(node for node, _ in visited_nodes_and_directions)
+        increment("visited_nodes", len(visited_nodes))
+        return visited_nodes
 
     def find_longest_traversal_path(self) -> set[Node]:
         longest_path: set[Node] = set()
@@ -140,3 +153,38 @@ class Graph:
     @property
     def height(self) -> int:
         return len(self.nodes)
+
+
+def get_energized_count(grid: Grid, start_coords: tuple[int, int], start_heading: Heading) -> int:
+    empty_transitions = HEADING_TRANSITIONS[ord(".")]
+    visited = bytearray(len(grid))
+    pending: list[tuple[int, Heading]] = [(grid.index(*start_coords), start_heading)]
+    while pending:
+        index, heading = pending.pop()
+        if visited[index] & (1 << heading):
+            continue
+        visited[index] |= 1 << heading
+        for next_heading in HEADING_TRANSITIONS.get(grid.cells[index], empty_transitions)[heading]:
+            next_index = grid.get_neighbour(index, next_heading)
+            if next_index is not None:
+                pending.append((next_index, next_heading))
+    visited_count = len(visited) - visited.count(0)
+    increment("visited_nodes", visited_count)
+    return visited_count
+
+
+def get_longest_energized_count(grid: Grid) -> int:
+    longest = 0
+    for col_index in range(grid.width):
+        longest = max(
+            longest,
+            get_energized_count(grid, (col_index, 0), Heading.SOUTH),
+            get_energized_count(grid, (col_index, grid.height - 1), Heading.NORTH),
+        )
+    for row_index in range(grid.height):
+        longest = max(
+            longest,
+            get_energized_count(grid, (0, row_index), Heading.EAST),
+            get_energized_count(grid, (grid.width - 1, row_index), Heading.WEST),
+        )
+    return longest
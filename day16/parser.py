@@ -1,23 +1,47 @@
 from io import TextIOBase
 
+from aoc.profiling import phase
+from aoc.reader import MappedInput
+
 from .graph import Graph, Node, NodeType
 
 
+def get_node_type(char: str) -> NodeType:
+    match char:
+        case "-" | "|":
+            return NodeType.SPLITTER
+        case "/" | "\\":
+            return NodeType.MIRROR
+        case _:
+            return NodeType.EMPTY
+
+
+NODE_TYPES = {ord(char): (get_node_type(char), char) for char in ".-|/\\"}
+
+
 def get_graph_from_input_data(input_data: TextIOBase) -> Graph:
     nodes: list[list[Node]] = []
     for row_index, line in enumerate(input_data):
         node_row: list[Node] = []
         nodes.append(node_row)
         for col_index, char in enumerate(line.strip()):
-            node_type: NodeType
-            match char:
-                case "-" | "|":
-                    node_type = NodeType.SPLITTER
-                case "/" | "\\":
-                    node_type = NodeType.MIRROR
-                case _:
-                    node_type = NodeType.EMPTY
-            node_row.append(Node(col_index, row_index, node_type, char))
+            node_row.append(Node(col_index, row_index, get_node_type(char), char))
     graph = Graph(nodes)
-    graph.link_nodes()
+    with phase("build"):
+        graph.link_nodes()
+    return graph
+
+
+def get_graph_from_mapped_input(input_data: MappedInput) -> Graph:
+    graph = Graph(
+        [
+            [
+                Node(col_index, row_index, *NODE_TYPES.get(char, (NodeType.EMPTY, chr(char))))
+                for col_index, char in enumerate(line)
+            ]
+            for row_index, line in enumerate(input_data.get_rows())
+        ]
+    )
+    with phase("build"):
+        graph.link_nodes()
     return graph
@@ -1,13 +1,16 @@
 #!/usr/bin/env python
 
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from day16.graph import Direction
-from day16.parser import get_graph_from_input_data
+from aoc.grid import Grid, Heading
+from aoc.profiling import phase
+from aoc.reader import MappedInput
+from day16.graph import Direction, get_energized_count, get_longest_energized_count
+from day16.parser import get_graph_from_input_data, get_graph_from_mapped_input
 
 
 parser = ArgumentParser()
@@ -19,12 +22,42 @@ parser.add_argument(
     "-l", "--longest",
     action="store_true"
 )
+parser.add_argument(
+    "--mmap",
+    action="store_true",
+)
+parser.add_argument(
+    "--compact",
+    action="store_true",
+)
 
-if __name__ == "__main__":
-    args = parser.parse_args()
-    graph = get_graph_from_input_data(args.data)
+
+def get_grid(args: Namespace) -> Grid:
+    if args.mmap:
+        with MappedInput(args.data.name) as input_data:
+            return Grid.from_mapped_input(input_data)
+    return Grid.from_lines(args.data)
+
+
+def solve(args: Namespace) -> int:
+    if args.compact:
+        with phase("parse"):
+            grid = get_grid(args)
+        if args.longest:
+            return get_longest_energized_count(grid)
+        return get_energized_count(grid, (0, 0), Heading.EAST)
+    with phase("parse"):
+        if args.mmap:
+            with MappedInput(args.data.name) as input_data:
+                graph = get_graph_from_mapped_input(input_data)
+        else:
+            graph = get_graph_from_input_data(args.data)
     if args.longest:
         path = graph.find_longest_traversal_path()
     else:
         path = graph.traverse((0, 0), Direction.EAST)
-    print(len(path))
+    return len(path)
+
+
+if __name__ == "__main__":
+    print(solve(parser.parse_args()))
@@ -1,8 +1,11 @@
 from io import StringIO
 from unittest import TestCase
 
-from .graph import Direction, Node, NodeType
-from .parser import get_graph_from_input_data
+from aoc.grid import Grid, Heading
+from aoc.testing import mapped_input
+
+from .graph import Direction, Node, NodeType, get_energized_count, get_longest_energized_count
+from .parser import get_graph_from_input_data, get_graph_from_mapped_input
 
 
 class ParserTestCase(TestCase):
@@ -32,6 +35,31 @@ class ParserTestCase(TestCase):
         self.assertIsInstance(graph[5, 0].linked_nodes[Direction.WEST], Node)
         self.assertIsInstance(graph[5, 0].linked_nodes[Direction.SOUTH], Node)
 
+    def test_mapped_input_parser(self):
+        with mapped_input(""".|...\\....
+|.-.\\.....
+.....|-...
+........|.
+..........
+.........\\
+..../.\\\\..
+.-.-/..|..
+.|....-|.\\
+..//.|....""") as input_data:
+            graph = get_graph_from_mapped_input(input_data)
+        self.assertEqual((graph.width, graph.height), (10, 10))
+        self.assertIs(graph[0, 1].type, NodeType.SPLITTER)
+        self.assertEqual(graph[0, 1].symbol, "|")
+        self.assertIs(graph[5, 0].type, NodeType.MIRROR)
+        self.assertEqual(graph[5, 0].symbol, "\\")
+        self.assertEqual(len(graph.traverse((0, 0), Direction.EAST)), 46)
+
+    def test_mapped_input_parser_unknown_symbol(self):
+        with mapped_input(".x.\n...") as input_data:
+            graph = get_graph_from_mapped_input(input_data)
+        self.assertIs(graph[1, 0].type, NodeType.EMPTY)
+        self.assertEqual(graph[1, 0].symbol, "x")
+
 
 class GraphTestCase(TestCase):
     def setUp(self):
@@ -86,3 +114,21 @@ class GraphTestCase(TestCase):
     def test_find_longest_traversal_path(self):
         longest_path = self.graph.find_longest_traversal_path()
         self.assertEqual(len(longest_path), 51)
+
+    def test_get_energized_count(self):
+        grid = Grid.from_lines(StringIO(""".|...\\....
+|.-.\\.....
+.....|-...
+........|.
+..........
+.........\\
+..../.\\\\..
+.-.-/..|..
+.|....-|.\\
+..//.|...."""))
+        self.assertEqual(get_energized_count(grid, (0, 0), Heading.EAST), 46)
+        self.assertEqual(get_longest_energized_count(grid), 51)
+
+    def test_get_energized_count_unknown_symbol(self):
+        grid = Grid.from_lines(StringIO(".x."))
+        self.assertEqual(get_energized_count(grid, (0, 0), Heading.EAST), 3)
@@ -1,9 +1,17 @@
 import heapq
+from array import array
 from collections import defaultdict
 from copy import copy
 from dataclasses import dataclass, field
 from enum import Enum, auto
 
+from aoc.grid import Grid, Heading
+from aoc.profiling import increment, phase
+
+LINK_ORDER = (Heading.NORTH, Heading.SOUTH, Heading.WEST, Heading.EAST)
+ZERO = ord("0")
+DIGITS = b"0123456789"
+
 
 class Direction(Enum):
     NORTH = auto()
@@ -32,7 +40,8 @@ class Node:
 class Graph:
     def __init__(self, nodes: list[list[Node]]):
         self.nodes = nodes
-        self.link_nodes()
+        with phase("build"):
+            self.link_nodes()
 
     def __getitem__(self, coords: tuple[int, int]) -> Node:
         return self.nodes[coords[1]][coords[0]]
@@ -72,6 +81,7 @@ class Graph:
         while expandable_nodes:
             distance_to_current, _, current = heapq.heappop(expandable_nodes)
             if current is to_node:
+                increment("heap_pushes", queue_entry_count - 1)
                 return sum(pair[0] for pair in paths[current])
             neighbors: dict[Direction, Node] = copy(current.linked_nodes)
             must_pivot = len(set(pair[1] for pair in paths[current][-1 * max_steps_between_pivot:])) == 1
@@ -90,6 +100,7 @@ class Graph:
                         (tentative_distance + self.get_ideal_distance(current, neighbor), queue_entry_count, neighbor)
                     )
                     queue_entry_count += 1
+        increment("heap_pushes", queue_entry_count - 1)
         raise RuntimeError("Goal was never reached")
 
     @property
@@ -100,3 +111,50 @@ class Graph:
     def height(self) -> int:
         return len(self.nodes)
 
+
+def get_shortest_path_on_grid(
+    grid: Grid,
+    from_coords: tuple[int, int],
+    to_coords: tuple[int, int],
+    max_steps_between_pivot: int = 3,
+) -> int:
+    if max_steps_between_pivot < 1:
+        raise ValueError("At least one step must be allowed between pivots")
+    if grid.cells.translate(None, DIGITS):
+        raise ValueError("Grid cells must all be digits")
+    from_index = grid.index(*from_coords)
+    to_index = grid.index(*to_coords)
+    known_distances = array("q", [-1]) * len(grid)
+    path_lengths = array("q", [0]) * len(grid)
+    run_lengths = array("q", [0]) * len(grid)
+    last_headings = bytearray(len(grid))
+    known_distances[from_index] = 0
+    expandable_nodes: list[tuple[int, int, int]] = [(0, 0, from_index)]
+    queue_entry_count = 1
+
+    while expandable_nodes:
+        _, _, current = heapq.heappop(expandable_nodes)
+        if current == to_index:
+            increment("heap_pushes", queue_entry_count - 1)
+            return known_distances[current]
+        path_length = path_lengths[current]
+        run_length = run_lengths[current]
+        must_pivot = path_length > 0 and run_length >= min(path_length, max_steps_between_pivot)
+        for heading in LINK_ORDER:
+            if must_pivot and heading == last_headings[current]:
+                continue
+            neighbor = grid.get_neighbour(current, heading)
+            if neighbor is None:
+                continue
+            tentative_distance = known_distances[current] + grid.cells[neighbor] - ZERO
+            if known_distances[neighbor] == -1 or tentative_distance < known_distances[neighbor]:
+                path_lengths[neighbor] = path_length + 1
+                run_lengths[neighbor] = (
+                    run_length + 1 if path_length and heading == last_headings[current] else 1
+                )
+                last_headings[neighbor] = heading
+                known_distances[neighbor] = tentative_distance
+                heapq.heappush(expandable_nodes, (tentative_distance + 1, queue_entry_count, neighbor))
+                queue_entry_count += 1
+    increment("heap_pushes", queue_entry_count - 1)
+    raise RuntimeError("Goal was never reached")
@@ -1,7 +1,18 @@
 from io import TextIOBase
 
+from aoc.reader import MappedInput
+
 from .graph import Direction, Graph, Node
 
+ZERO = ord("0")
+
+
+def get_weight(char: int) -> int:
+    weight = char - ZERO
+    if not 0 <= weight <= 9:
+        raise ValueError(f"Invalid weight: {chr(char)}")
+    return weight
+
 
 def get_graph_from_input_data(input_data: TextIOBase) -> Graph:
     return Graph(
@@ -10,3 +21,12 @@ def get_graph_from_input_data(input_data: TextIOBase) -> Graph:
             for row_index, line in enumerate(input_data)
         ]
     )
+
+
+def get_graph_from_mapped_input(input_data: MappedInput) -> Graph:
+    return Graph(
+        [
+            [Node(col_index, row_index, get_weight(char)) for col_index, char in enumerate(line)]
+            for row_index, line in enumerate(input_data.get_rows())
+        ]
+    )
@@ -1,8 +1,11 @@
 from io import StringIO
 from unittest import TestCase
 
-from .graph import Direction
-from .parser import get_graph_from_input_data
+from aoc.grid import Grid
+from aoc.testing import mapped_input
+
+from .graph import Direction, get_shortest_path_on_grid
+from .parser import get_graph_from_input_data, get_graph_from_mapped_input
 
 
 class ParserTestCase(TestCase):
@@ -39,6 +42,35 @@ class ParserTestCase(TestCase):
         self.assertIs(graph[6, 6].linked_nodes[Direction.WEST], graph[5, 6])
         self.assertEqual(graph[6, 6].intrinsic_weight, 6)
 
+    def test_mapped_input_parser(self):
+        with mapped_input("""2413432311323
+3215453535623
+3255245654254
+3446585845452
+4546657867536
+1438598798454
+4457876987766
+3637877979653
+4654967986887
+4564679986453
+1224686865563
+2546548887735
+4322674655533
+""") as input_data:
+            graph = get_graph_from_mapped_input(input_data)
+        self.assertEqual((graph.width, graph.height), (13, 13))
+        self.assertEqual(graph[0, 0].intrinsic_weight, 2)
+        self.assertEqual(graph[6, 6].intrinsic_weight, 6)
+        self.assertEqual(graph.get_shortest_path(graph[0, 0], graph[12, 12]), 102)
+
+    def test_mapped_input_parser_whitespace(self):
+        with mapped_input("123 \n456 \n789 \n") as input_data:
+            graph = get_graph_from_mapped_input(input_data)
+        self.assertEqual((graph.width, graph.height), (3, 3))
+        with mapped_input("12x\n456\n") as input_data:
+            with self.assertRaises(ValueError):
+                get_graph_from_mapped_input(input_data)
+
 
 class GraphTestCase(TestCase):
     def setUp(self):
@@ -81,3 +113,30 @@ class GraphTestCase(TestCase):
             self.graph.get_shortest_path(self.graph[0, 0], self.graph[12, 12]),
             102
         )
+
+    def test_get_shortest_path_on_grid(self):
+        grid = Grid.from_lines(StringIO("""2413432311323
+3215453535623
+3255245654254
+3446585845452
+4546657867536
+1438598798454
+4457876987766
+3637877979653
+4654967986887
+4564679986453
+1224686865563
+2546548887735
+4322674655533"""))
+        self.assertEqual(get_shortest_path_on_grid(grid, (0, 0), (12, 12)), 102)
+        with self.assertRaises(ValueError):
+            get_shortest_path_on_grid(grid, (0, 0), (12, 12), 0)
+
+    def test_get_shortest_path_on_grid_rejects_non_digits(self):
+        with mapped_input("123 \n456 \n789 \n") as input_data:
+            grid = Grid.from_mapped_input(input_data)
+        self.assertEqual((grid.width, grid.height), (3, 3))
+        self.assertEqual(get_shortest_path_on_grid(grid, (0, 0), (2, 2)), 22)
+        grid = Grid.from_lines(StringIO("12x\n456\n789"))
+        with self.assertRaises(ValueError):
+            get_shortest_path_on_grid(grid, (0, 0), (2, 2))
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from enum import StrEnum
 
+from aoc.grid import Grid, Heading
+
 
 class NodeType(StrEnum):
     EDGE = "#"
@@ -131,3 +133,42 @@ class Graph:
     @property
     def height(self) -> int:
         return len(self.nodes)
+
+
+def get_interior_indices_on_grid(grid: Grid, edge: int = ord(NodeType.EDGE)) -> list[int]:
+    visited = bytearray(len(grid))
+    for index, cell in enumerate(grid.cells):
+        x, _ = grid.coords(index)
+        if (
+            cell == edge
+            and (x == 0 or grid.cells[index - 1] != edge)
+            and x < grid.width - 1
+            and grid.cells[index + 1] != edge
+        ):
+            unexpanded_indices = [index + 1]
+            interior_indices = [index + 1]
+            visited[index + 1] = 1
+            while unexpanded_indices:
+                current = unexpanded_indices.pop()
+                for heading in Heading:
+                    adjacent_index = grid.get_neighbour(current, heading)
+                    if (
+                        adjacent_index is not None
+                        and not visited[adjacent_index]
+                        and grid.cells[adjacent_index] != edge
+                    ):
+                        visited[adjacent_index] = 1
+                        unexpanded_indices.append(adjacent_index)
+                        interior_indices.append(adjacent_index)
+            return interior_indices
+    return []
+
+
+def mark_interior_on_grid(grid: Grid, edge: int = ord(NodeType.EDGE)):
+    interior = ord(NodeType.INTERIOR)
+    for index in get_interior_indices_on_grid(grid, edge):
+        grid.cells[index] = interior
+
+
+def get_area_on_grid(grid: Grid, edge: int = ord(NodeType.EDGE)) -> int:
+    return len(get_interior_indices_on_grid(grid, edge)) + grid.cells.count(edge)
@@ -1,6 +1,9 @@
 import re
+from collections.abc import Generator
 from io import TextIOBase
 
+from aoc.grid import Grid
+
 from .graph import Direction, Graph, Node, NodeType
 
 
@@ -20,11 +23,10 @@ def parse_hex_param(hex_param) -> tuple[int, Direction]:
     return int(hex_param[:5], base=16), direction
 
 
-def get_graph_from_input_data(input_data: TextIOBase, use_hex_param: bool = False) -> Graph:
-    x = 0
-    y = 0
-    current_node = Node(x, y, type=NodeType.EDGE)
-    edge_nodes: dict[tuple[int, int], Node] = {(x, y): current_node}
+def iter_instructions_from_input_data(
+    input_data: TextIOBase,
+    use_hex_param: bool = False,
+) -> Generator[tuple[Direction, int]]:
     for line in input_data:
         match = re.match(r"^([RDLU]) (\d+) \(#([a-f0-9]{6})\)", line)
         assert match is not None
@@ -33,18 +35,51 @@ def get_graph_from_input_data(input_data: TextIOBase, use_hex_param: bool = Fals
         else:
             direction = Direction(match.group(1))
             step_count = int(match.group(2))
+        yield direction, step_count
+
+
+def move(x: int, y: int, direction: Direction, step_count: int = 1) -> tuple[int, int]:
+    match direction:
+        case Direction.NORTH:
+            return x, y - step_count
+        case Direction.SOUTH:
+            return x, y + step_count
+        case Direction.EAST:
+            return x + step_count, y
+        case _:
+            return x - step_count, y
+
+
+def get_graph_from_input_data(input_data: TextIOBase, use_hex_param: bool = False) -> Graph:
+    x = 0
+    y = 0
+    current_node = Node(x, y, type=NodeType.EDGE)
+    edge_nodes: dict[tuple[int, int], Node] = {(x, y): current_node}
+    for direction, step_count in iter_instructions_from_input_data(input_data, use_hex_param):
         for _ in range(step_count):
-            match direction:
-                case Direction.NORTH:
-                    y -= 1
-                case Direction.SOUTH:
-                    y += 1
-                case Direction.EAST:
-                    x += 1
-                case _:
-                    x -= 1
+            x, y = move(x, y, direction)
             next_node = edge_nodes.get((x, y), Node(x, y, type=NodeType.EDGE))
             current_node.link_to(next_node, direction)
             edge_nodes[x, y] = next_node
             current_node = next_node
     return Graph(list(edge_nodes.values()))
+
+
+def get_grid_from_input_data(input_data: TextIOBase, use_hex_param: bool = False) -> Grid:
+    instructions = list(iter_instructions_from_input_data(input_data, use_hex_param))
+    x = y = min_x = max_x = min_y = max_y = 0
+    for direction, step_count in instructions:
+        x, y = move(x, y, direction, step_count)
+        min_x, max_x = min(min_x, x), max(max_x, x)
+        min_y, max_y = min(min_y, y), max(max_y, y)
+    width = max_x - min_x + 1
+    height = max_y - min_y + 1
+    grid = Grid(width, height, bytearray(NodeType.UNKNOWN.encode()) * (width * height))
+    edge = ord(NodeType.EDGE)
+    x, y = -min_x, -min_y
+    grid[x, y] = edge
+    for direction, step_count in instructions:
+        for _ in range(step_count):
+            x, y = move(x, y, direction)
+            grid[x, y] = edge
+    return grid
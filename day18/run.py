@@ -1,12 +1,14 @@
 #!/usr/bin/env python
 
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from day18.parser import get_graph_from_input_data
+from aoc.profiling import phase
+from day18.graph import get_area_on_grid, mark_interior_on_grid
+from day18.parser import get_graph_from_input_data, get_grid_from_input_data
 
 
 parser = ArgumentParser()
@@ -18,12 +20,27 @@ parser.add_argument(
     "-d", "--debug",
     action="store_true"
 )
+parser.add_argument(
+    "--compact",
+    action="store_true",
+)
 
-if __name__ == "__main__":
-    args = parser.parse_args()
-    graph = get_graph_from_input_data(args.data)
+
+def solve(args: Namespace) -> int | str:
+    if args.compact:
+        with phase("parse"):
+            grid = get_grid_from_input_data(args.data)
+        if args.debug:
+            mark_interior_on_grid(grid)
+            return str(grid)
+        return get_area_on_grid(grid)
+    with phase("parse"):
+        graph = get_graph_from_input_data(args.data)
     if args.debug:
         graph.mark_interior_nodes()
-        print(graph)
-    else:
-        print(graph.get_area())
+        return str(graph)
+    return graph.get_area()
+
+
+if __name__ == "__main__":
+    print(solve(parser.parse_args()))
@@ -1,8 +1,8 @@
 from io import StringIO
 from unittest import TestCase
 
-from .graph import Direction
-from .parser import get_graph_from_input_data
+from .graph import Direction, get_area_on_grid, mark_interior_on_grid
+from .parser import get_graph_from_input_data, get_grid_from_input_data
 
 
 class ParserTestCase(TestCase):
@@ -48,3 +48,40 @@ U 2 (#7a21e3)"""))
 
     def test_get_area(self):
         self.assertEqual(self.graph.get_area(), 62)
+
+    def test_get_area_on_grid(self):
+        grid = get_grid_from_input_data(StringIO("""R 6 (#70c710)
+D 5 (#0dc571)
+L 2 (#5713f0)
+D 2 (#d2c081)
+R 2 (#59c680)
+D 2 (#411b91)
+L 5 (#8ceee2)
+U 2 (#caa173)
+L 1 (#1b58a2)
+U 2 (#caa171)
+R 2 (#7807d2)
+U 3 (#a77fa3)
+L 2 (#015232)
+U 2 (#7a21e3)"""))
+        self.assertEqual((grid.width, grid.height), (7, 10))
+        self.assertEqual(get_area_on_grid(grid), 62)
+
+    def test_mark_interior_on_grid(self):
+        grid = get_grid_from_input_data(StringIO("""R 6 (#70c710)
+D 5 (#0dc571)
+L 2 (#5713f0)
+D 2 (#d2c081)
+R 2 (#59c680)
+D 2 (#411b91)
+L 5 (#8ceee2)
+U 2 (#caa173)
+L 1 (#1b58a2)
+U 2 (#caa171)
+R 2 (#7807d2)
+U 3 (#a77fa3)
+L 2 (#015232)
+U 2 (#7a21e3)"""))
+        mark_interior_on_grid(grid)
+        self.graph.mark_interior_nodes()
+        self.assertEqual(str(grid), str(self.graph))
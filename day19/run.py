@@ -1,11 +1,12 @@
 #!/usr/bin/env python
 
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+from aoc.profiling import phase
 from day19.parser import get_orchestrator_and_part_list_from_input_data
 from day19.workflow import Result
 
@@ -16,7 +17,12 @@ parser.add_argument(
     type=open,
 )
 
+
+def solve(args: Namespace) -> int:
+    with phase("parse"):
+        orchestrator, parts = get_orchestrator_and_part_list_from_input_data(args.data)
+    return sum(int(part) for part in parts if orchestrator.entry_workflow(part) is Result.ACCEPTED)
+
+
 if __name__ == "__main__":
-    args = parser.parse_args()
-    orchestrator, parts = get_orchestrator_and_part_list_from_input_data(args.data)
-    print(sum(int(part) for part in parts if orchestrator.entry_workflow(part) is Result.ACCEPTED))
+    print(solve(parser.parse_args()))
@@ -1,4 +1,10 @@
-from .game import Game, CubeSet
+from array import array
+from collections.abc import Generator, Iterable
+from operator import itemgetter
+
+from .game import Game, GameTable, CubeSet
+
+LEAF_SIZE = 16
 
 
 class Calculator:
@@ -12,3 +18,96 @@ class Calculator:
 
     def get_game_possibility(self, game: Game) -> bool:
         return all(self.get_round_possibility(round) for round in game.rounds)
+
+
+class DominanceIndex:
+    def __init__(self, entries: Iterable[tuple[int, CubeSet]]):
+        self.entries = [
+            (minimum_viable_set.red, minimum_viable_set.green, minimum_viable_set.blue, game_id)
+            for game_id, minimum_viable_set in entries
+        ]
+        self.starts = array("q")
+        self.stops = array("q")
+        self.lower_bounds: list[tuple[int, int, int]] = []
+        self.upper_bounds: list[tuple[int, int, int]] = []
+        self.counts = array("q")
+        self.id_sums = array("q")
+        self.children: list[tuple[int, int] | None] = []
+        if self.entries:
+            self.build(0, len(self.entries), 0)
+
+    @classmethod
+    def from_games(cls, games: Iterable[Game]) -> "DominanceIndex":
+        return cls((game.id, game.get_minimum_viable_set()) for game in games)
+
+    @classmethod
+    def from_table(cls, table: GameTable) -> "DominanceIndex":
+        return cls((table.ids[index], table.get_minimum_viable_set(index)) for index in range(len(table)))
+
+    def build(self, start: int, stop: int, axis: int) -> int:
+        node = len(self.starts)
+        entries = self.entries[start:stop]
+        self.starts.append(start)
+        self.stops.append(stop)
+        self.lower_bounds.append(tuple(min(entry[i] for entry in entries) for i in range(3)))
+        self.upper_bounds.append(tuple(max(entry[i] for entry in entries) for i in range(3)))
+        self.counts.append(len(entries))
+        self.id_sums.append(sum(entry[3] for entry in entries))
+        self.children.append(None)
+        if stop - start > LEAF_SIZE:
+            entries.sort(key=itemgetter(axis))
+            self.entries[start:stop] = entries
+            middle = (start + stop) // 2
+            next_axis = (axis + 1) % 3
+            self.children[node] = (self.build(start, middle, next_axis), self.build(middle, stop, next_axis))
+        return node
+
+    def iter_matches(self, red: int, green: int, blue: int) -> Generator[tuple[int, bool]]:
+        if not self.entries:
+            return
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            lower_red, lower_green, lower_blue = self.lower_bounds[node]
+            if lower_red > red or lower_green > green or lower_blue > blue:
+                continue
+            upper_red, upper_green, upper_blue = self.upper_bounds[node]
+            if upper_red <= red and upper_green <= green and upper_blue <= blue:
+                yield node, True
+            elif self.children[node] is None:
+                yield node, False
+            else:
+                stack.extend(self.children[node])
+
+    def iter_possible_entries(self, red: int, green: int, blue: int) -> Generator[tuple[int, int, int, int]]:
+        for node, contained in self.iter_matches(red, green, blue):
+            for entry in self.entries[self.starts[node]:self.stops[node]]:
+                if contained or (entry[0] <= red and entry[1] <= green and entry[2] <= blue):
+                    yield entry
+
+    def get_possible_count(self, red: int, green: int, blue: int) -> int:
+        count = 0
+        for node, contained in self.iter_matches(red, green, blue):
+            if contained:
+                count += self.counts[node]
+            else:
+                count += sum(
+                    1 for entry in self.entries[self.starts[node]:self.stops[node]]
+                    if entry[0] <= red and entry[1] <= green and entry[2] <= blue
+                )
+        return count
+
+    def get_id_sum(self, red: int, green: int, blue: int) -> int:
+        id_sum = 0
+        for node, contained in self.iter_matches(red, green, blue):
+            if contained:
+                id_sum += self.id_sums[node]
+            else:
+                id_sum += sum(
+                    entry[3] for entry in self.entries[self.starts[node]:self.stops[node]]
+                    if entry[0] <= red and entry[1] <= green and entry[2] <= blue
+                )
+        return id_sum
+
+    def get_possible_ids(self, red: int, green: int, blue: int) -> list[int]:
+        return sorted(entry[3] for entry in self.iter_possible_entries(red, green, blue))
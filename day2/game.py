@@ -1,4 +1,6 @@
-from dataclasses import dataclass, fields
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass, field, fields
 
 
 @dataclass
@@ -23,3 +25,64 @@ class Game:
 
 
 COLORS = [field.name for field in fields(CubeSet)]
+
+
+@dataclass
+class GameTable:
+    ids: array = field(default_factory=lambda: array("q"))
+    red: array = field(default_factory=lambda: array("q"))
+    green: array = field(default_factory=lambda: array("q"))
+    blue: array = field(default_factory=lambda: array("q"))
+
+    @classmethod
+    def from_games(cls, games: Iterable[Game]) -> "GameTable":
+        table = cls()
+        for game in games:
+            minimum_viable_set = game.get_minimum_viable_set()
+            table.append(game.id, minimum_viable_set.red, minimum_viable_set.green, minimum_viable_set.blue)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, game_id: int, red: int, green: int, blue: int):
+        self.ids.append(game_id)
+        self.red.append(red)
+        self.green.append(green)
+        self.blue.append(blue)
+
+    def get_minimum_viable_set(self, index: int) -> CubeSet:
+        return CubeSet(red=self.red[index], green=self.green[index], blue=self.blue[index])
+
+    def get_groups(self) -> dict[tuple[int, int, int], tuple[int, int]]:
+        groups: dict[tuple[int, int, int], tuple[int, int]] = {}
+        for game_id, maxima in zip(self.ids, zip(self.red, self.green, self.blue)):
+            count, id_sum = groups.get(maxima, (0, 0))
+            groups[maxima] = (count + 1, id_sum + game_id)
+        return groups
+
+    def get_possible_ids(self, red: int, green: int, blue: int) -> list[int]:
+        return [
+            game_id
+            for game_id, game_red, game_green, game_blue in zip(self.ids, self.red, self.green, self.blue)
+            if game_red <= red and game_green <= green and game_blue <= blue
+        ]
+
+    def get_possible_counts_and_id_sums(self, limits: Iterable[tuple[int, int, int]]) -> list[tuple[int, int]]:
+        groups = list(self.get_groups().items())
+        results: list[tuple[int, int]] = []
+        for red, green, blue in limits:
+            possible_count = 0
+            id_sum = 0
+            for (game_red, game_green, game_blue), (count, group_id_sum) in groups:
+                if game_red <= red and game_green <= green and game_blue <= blue:
+                    possible_count += count
+                    id_sum += group_id_sum
+            results.append((possible_count, id_sum))
+        return results
+
+    def get_id_sums(self, limits: Iterable[tuple[int, int, int]]) -> list[int]:
+        return [id_sum for _, id_sum in self.get_possible_counts_and_id_sums(limits)]
+
+    def get_power_sum(self) -> int:
+        return sum(red * green * blue for red, green, blue in zip(self.red, self.green, self.blue))
@@ -2,27 +2,63 @@ import re
 from collections.abc import Generator
 from io import TextIOBase
 
-from .game import COLORS, Game, CubeSet
+from .game import COLORS, Game, GameTable, CubeSet
+
+GAME_PATTERN = re.compile(r"Game (\d+):")
+TOKEN_PATTERN = re.compile(r"(\d+) ({})|;".format("|".join(COLORS)))
+COLOR_INDICES = {color: index for index, color in enumerate(COLORS)}
 
 
 class InvalidDataError(ValueError):
     pass
 
 
+def get_game_id(line: str) -> tuple[int, int]:
+    match = GAME_PATTERN.match(line)
+    if not match:
+        raise InvalidDataError
+    return int(match.group(1)), match.end()
+
+
+def iter_round_counts(line: str, pos: int = 0) -> Generator[list[int]]:
+    counts = [0] * len(COLORS)
+    seen = [False] * len(COLORS)
+    for count, color in TOKEN_PATTERN.findall(line, pos):
+        if not color:
+            yield counts
+            counts = [0] * len(COLORS)
+            seen = [False] * len(COLORS)
+            continue
+        index = COLOR_INDICES[color]
+        if not seen[index]:
+            seen[index] = True
+            counts[index] = int(count)
+    yield counts
+
+
 def get_games_from_input(input_data: TextIOBase) -> Generator[Game]:
     for line in input_data:
-        match = re.search(r"^Game (\d+):", line)
-        if not match:
-            raise InvalidDataError
-        game_id = int(match.group(1))
-        rounds: list[CubeSet] = []
-        all_round_data = line[line.index(":") + 1:].strip()
-        for round_data in all_round_data.split(";"):
-            round = CubeSet()
-            for color in COLORS:
-                match = re.search(r"(\d+) {}".format(color), round_data)
-                if match:
-                    setattr(round, color, int(match.group(1)))
-            if round.red or round.blue or round.green:
-                rounds.append(round)
-        yield Game(id=game_id, rounds=rounds)
+        game_id, pos = get_game_id(line)
+        yield Game(
+            id=game_id,
+            rounds=[CubeSet(*counts) for counts in iter_round_counts(line, pos) if any(counts)],
+        )
+
+
+def get_game_table_from_input(input_data: TextIOBase) -> GameTable:
+    table = GameTable()
+    for line in input_data:
+        game_id, pos = get_game_id(line)
+        maxima = [0] * len(COLORS)
+        seen = [False] * len(COLORS)
+        for count, color in TOKEN_PATTERN.findall(line, pos):
+            if not color:
+                seen = [False] * len(COLORS)
+                continue
+            index = COLOR_INDICES[color]
+            if not seen[index]:
+                seen[index] = True
+                if int(count) > maxima[index]:
+                    maxima[index] = int(count)
+        table.append(game_id, *maxima)
+    return table
@@ -1,13 +1,14 @@
 #!/usr/bin/env python
 
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from day2.calculator import Calculator
-from day2.parser import get_games_from_input
+from aoc.profiling import phase
+from day2.calculator import DominanceIndex
+from day2.parser import get_game_table_from_input
 
 
 parser = ArgumentParser()
@@ -31,17 +32,26 @@ parser.add_argument(
     "-m", "--mode",
     choices=["possibility", "viability"]
 )
+parser.add_argument(
+    "-l", "--limits",
+    type=int,
+    nargs=3,
+    action="append",
+    metavar=("RED", "GREEN", "BLUE"),
+)
+
+
+def solve(args: Namespace) -> int | str:
+    with phase("parse"):
+        table = get_game_table_from_input(args.data)
+    if args.limits:
+        with phase("build"):
+            index = DominanceIndex.from_table(table)
+        return "\n".join(str(index.get_id_sum(red, green, blue)) for red, green, blue in args.limits)
+    if args.mode == "possibility":
+        return table.get_id_sums([(args.red, args.green, args.blue)])[0]
+    return table.get_power_sum()
 
 
 if __name__ == "__main__":
-    args = parser.parse_args()
-    result = 0
-    calculator = Calculator(red=args.red, green=args.green, blue=args.blue)
-    for game in get_games_from_input(args.data):
-        if args.mode == "possibility":
-            if calculator.get_game_possibility(game):
-                result += game.id
-        else:
-            minimum_viable_set = game.get_minimum_viable_set()
-            result += minimum_viable_set.red * minimum_viable_set.green * minimum_viable_set.blue
-    print(result)
+    print(solve(parser.parse_args()))
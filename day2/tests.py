@@ -1,9 +1,10 @@
 from io import StringIO
+from random import Random
 from unittest import TestCase
 
-from .calculator import Calculator
-from .game import Game, CubeSet
-from .parser import get_games_from_input
+from .calculator import Calculator, DominanceIndex
+from .game import Game, GameTable, CubeSet
+from .parser import InvalidDataError, get_game_table_from_input, get_games_from_input, iter_round_counts
 
 
 class CalculatorTestCase(TestCase):
@@ -96,6 +97,55 @@ class CalculatorTestCase(TestCase):
         )
 
 
+class DominanceIndexTestCase(TestCase):
+    def setUp(self):
+        self.index = DominanceIndex.from_games(
+            [
+                Game(id=1, rounds=[CubeSet(blue=3, red=4), CubeSet(red=1, green=2, blue=6), CubeSet(green=2)]),
+                Game(id=2, rounds=[CubeSet(blue=1, green=2), CubeSet(green=3, blue=4, red=1)]),
+                Game(id=3, rounds=[CubeSet(green=8, blue=6, red=20), CubeSet(blue=5, red=4, green=13)]),
+                Game(id=4, rounds=[CubeSet(green=1, red=3, blue=6), CubeSet(green=3, blue=15, red=14)]),
+                Game(id=5, rounds=[CubeSet(red=6, blue=1, green=3), CubeSet(blue=2, red=1, green=2)]),
+            ]
+        )
+
+    def test_get_id_sum(self):
+        self.assertEqual(self.index.get_id_sum(12, 13, 14), 8)
+        self.assertEqual(self.index.get_id_sum(20, 13, 15), 15)
+        self.assertEqual(self.index.get_id_sum(0, 0, 0), 0)
+
+    def test_get_possible_count(self):
+        self.assertEqual(self.index.get_possible_count(12, 13, 14), 3)
+        self.assertEqual(self.index.get_possible_count(100, 100, 100), 5)
+
+    def test_get_possible_ids(self):
+        self.assertEqual(self.index.get_possible_ids(12, 13, 14), [1, 2, 5])
+        self.assertEqual(self.index.get_possible_ids(14, 3, 15), [1, 2, 4, 5])
+
+    def test_empty_index(self):
+        index = DominanceIndex([])
+        self.assertEqual(index.get_id_sum(1, 1, 1), 0)
+        self.assertEqual(index.get_possible_ids(1, 1, 1), [])
+
+    def test_many_distinct_maxima(self):
+        rng = Random(2)
+        entries = [
+            (game_id, CubeSet(red=rng.randrange(500), green=rng.randrange(500), blue=rng.randrange(500)))
+            for game_id in range(1, 2001)
+        ]
+        index = DominanceIndex(entries)
+        self.assertLess(len(index.counts), 2 * len(entries))
+        for _ in range(50):
+            red, green, blue = rng.randrange(550), rng.randrange(550), rng.randrange(550)
+            expected = [
+                game_id for game_id, cube_set in entries
+                if cube_set.red <= red and cube_set.green <= green and cube_set.blue <= blue
+            ]
+            self.assertEqual(index.get_possible_ids(red, green, blue), expected)
+            self.assertEqual(index.get_possible_count(red, green, blue), len(expected))
+            self.assertEqual(index.get_id_sum(red, green, blue), sum(expected))
+
+
 class ParserTestCase(TestCase):
     def test_get_games_from_input(self):
         input_data = StringIO("""Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
@@ -148,6 +198,18 @@ Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green""")
             ]
         )
 
+    def test_iter_round_counts(self):
+        self.assertEqual(
+            list(iter_round_counts(" 3 blue, 4 red; 1 red, 2 red, 6 blue;; 2 green")),
+            [[4, 0, 3], [1, 0, 6], [0, 0, 0], [0, 2, 0]],
+        )
+
+    def test_invalid_header(self):
+        with self.assertRaises(InvalidDataError):
+            list(get_games_from_input(StringIO("Round 1: 3 blue")))
+        with self.assertRaises(InvalidDataError):
+            get_game_table_from_input(StringIO("Round 1: 3 blue"))
+
 
 class GameTestCase(TestCase):
     def test_get_minimum_viable_set(self):
@@ -203,3 +265,41 @@ class GameTestCase(TestCase):
             [game.get_minimum_viable_set() for game in games],
             expected,
         )
+
+
+class GameTableTestCase(TestCase):
+    def setUp(self):
+        self.table = get_game_table_from_input(StringIO("""Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green
+Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue
+Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red
+Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red
+Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green"""))
+
+    def test_get_game_table_from_input(self):
+        self.assertEqual(len(self.table), 5)
+        self.assertEqual(list(self.table.ids), [1, 2, 3, 4, 5])
+        self.assertEqual(self.table.get_minimum_viable_set(2), CubeSet(red=20, green=13, blue=6))
+
+    def test_from_games(self):
+        games = [
+            Game(id=7, rounds=[CubeSet(red=2, blue=1), CubeSet(green=5)]),
+            Game(id=9, rounds=[]),
+        ]
+        table = GameTable.from_games(games)
+        self.assertEqual(list(table.red), [2, 0])
+        self.assertEqual(list(table.green), [5, 0])
+        self.assertEqual(list(table.blue), [1, 0])
+
+    def test_get_possible_ids(self):
+        self.assertEqual(self.table.get_possible_ids(12, 13, 14), [1, 2, 5])
+        self.assertEqual(self.table.get_possible_ids(0, 0, 0), [])
+
+    def test_bulk_queries(self):
+        self.assertEqual(
+            self.table.get_possible_counts_and_id_sums([(12, 13, 14), (20, 13, 15), (1, 3, 4)]),
+            [(3, 8), (5, 15), (1, 2)],
+        )
+        self.assertEqual(self.table.get_id_sums([(12, 13, 14)]), [8])
+
+    def test_get_power_sum(self):
+        self.assertEqual(self.table.get_power_sum(), 2286)
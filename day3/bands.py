@@ -0,0 +1,41 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc.reader import MappedInput
+
+from .parser import get_line_from_bytes
+
+BAND_SIZE = 1 << 20
+
+
+def get_band_total(path: str, start: int, end: int, mode: str) -> int:
+    with MappedInput(path) as input_data:
+        data = input_data.data
+        halo_start = data.rfind(b"\n", 0, start - 1) + 1 if start else start
+        halo_end = data.find(b"\n", end) if end < len(data) else end
+        if halo_end == -1:
+            halo_end = len(data)
+        lines = [get_line_from_bytes(line) for line in data[halo_start:halo_end].splitlines()]
+    first_core_index = 1 if halo_start < start else 0
+    last_core_index = len(lines) - 1 if halo_end > end else len(lines)
+    total = 0
+    for index in range(first_core_index, last_core_index):
+        previous_line = lines[index - 1] if index > 0 else None
+        next_line = lines[index + 1] if index < len(lines) - 1 else None
+        if mode == "part-numbers":
+            total += sum(lines[index].get_part_numbers(previous_line, next_line))
+        else:
+            total += sum(lines[index].get_gear_ratios(previous_line, next_line))
+    return total
+
+
+def get_total_from_bands(
+    path: str,
+    mode: str,
+    band_size: int = BAND_SIZE,
+    max_workers: int | None = None,
+) -> int:
+    with MappedInput(path) as input_data:
+        offsets = input_data.get_chunk_offsets(band_size)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(get_band_total, path, start, end, mode) for start, end in offsets]
+        return sum(future.result() for future in futures)
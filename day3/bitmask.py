@@ -0,0 +1,65 @@
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Generator
+from dataclasses import dataclass, field
+
+NUMBER_PATTERN = re.compile(r"\d+")
+SYMBOL_PATTERN = re.compile(r"[^.\d\s]+")
+
+
+@dataclass
+class BitmaskRow:
+    symbol_mask: int = 0
+    number_starts: list[int] = field(default_factory=list)
+    number_stops: list[int] = field(default_factory=list)
+    number_values: list[int] = field(default_factory=list)
+    gears: list[int] = field(default_factory=list)
+
+    @classmethod
+    def from_string(cls, line: str) -> "BitmaskRow":
+        row = cls()
+        for match in SYMBOL_PATTERN.finditer(line):
+            row.symbol_mask |= ((1 << (match.end() - match.start())) - 1) << match.start()
+            if match.group() == "*":
+                row.gears.append(match.start())
+        for match in NUMBER_PATTERN.finditer(line):
+            row.number_starts.append(match.start())
+            row.number_stops.append(match.end())
+            row.number_values.append(int(match.group()))
+        return row
+
+    @property
+    def dilated_symbol_mask(self) -> int:
+        return self.symbol_mask | (self.symbol_mask << 1) | (self.symbol_mask >> 1)
+
+    def get_numbers_in_range(self, start: int, stop: int) -> list[int]:
+        return self.number_values[bisect_right(self.number_stops, start):bisect_left(self.number_starts, stop)]
+
+
+@dataclass
+class BitmaskSchematic:
+    rows: list[BitmaskRow] = field(default_factory=list)
+
+    def get_adjacency_masks(self) -> list[int]:
+        dilated_masks = [0] + [row.dilated_symbol_mask for row in self.rows] + [0]
+        return [
+            dilated_masks[index - 1] | dilated_masks[index] | dilated_masks[index + 1]
+            for index in range(1, len(dilated_masks) - 1)
+        ]
+
+    def get_part_numbers(self) -> Generator[int]:
+        for row, adjacency_mask in zip(self.rows, self.get_adjacency_masks()):
+            for start, stop, value in zip(row.number_starts, row.number_stops, row.number_values):
+                if adjacency_mask & (((1 << (stop - start)) - 1) << start):
+                    yield value
+
+    def get_gear_ratios(self) -> Generator[int]:
+        for row_index, row in enumerate(self.rows):
+            for pos in row.gears:
+                adjacent_numbers: list[int] = []
+                for adjacent_index in (row_index - 1, row_index + 1):
+                    if 0 <= adjacent_index < len(self.rows):
+                        adjacent_numbers.extend(self.rows[adjacent_index].get_numbers_in_range(pos - 1, pos + 2))
+                adjacent_numbers.extend(row.get_numbers_in_range(pos - 1, pos + 2))
+                if len(adjacent_numbers) == 2:
+                    yield adjacent_numbers[0] * adjacent_numbers[1]
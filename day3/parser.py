@@ -1,33 +1,72 @@
+import re
+from collections.abc import Generator
 from io import TextIOBase
 
+from aoc.reader import MappedInput
+
+from .bitmask import BitmaskRow, BitmaskSchematic
 from .schematic import Element, Line, Schematic
 
+ELEMENT_PATTERN = re.compile(rb"\d+|[^.\d\s]+")
 
-def get_schematic_from_input(input_data: TextIOBase) -> Schematic:
-    parsed_lines: list[Line] = []
-    for line in input_data:
-        parsed_elements: list[Element] = []
-        current_value: str | None = None
-        current_value_start: int = 0
-        for pos, char in enumerate(line.strip()):
-            if char == ".":
+
+def get_line_from_string(line: str) -> Line:
+    parsed_elements: list[Element] = []
+    current_value: str | None = None
+    current_value_start: int = 0
+    for pos, char in enumerate(line.strip()):
+        if char == ".":
+            if current_value:
+                parsed_elements.append(
+                    Element(value=current_value, start=current_value_start)
+                )
+                current_value = None
+        else:
+            if not current_value or char.isdigit() != current_value[-1].isdigit():
                 if current_value:
                     parsed_elements.append(
                         Element(value=current_value, start=current_value_start)
                     )
-                    current_value = None
-            else:
-                if not current_value or char.isdigit() != current_value[-1].isdigit():
-                    if current_value:
-                        parsed_elements.append(
-                            Element(value=current_value, start=current_value_start)
-                        )
-                    current_value = ""
-                    current_value_start = pos
-                current_value += char
-        if current_value:
-            parsed_elements.append(
-                Element(value=current_value, start=current_value_start)
-            )
-        parsed_lines.append(Line(elements=parsed_elements))
-    return Schematic(lines=parsed_lines)
+                current_value = ""
+                current_value_start = pos
+            current_value += char
+    if current_value:
+        parsed_elements.append(
+            Element(value=current_value, start=current_value_start)
+        )
+    return Line(elements=parsed_elements)
+
+
+def get_line_from_bytes(line: bytes | memoryview) -> Line:
+    return Line(
+        elements=[
+            Element(value=match.group().decode(), start=match.start())
+            for match in ELEMENT_PATTERN.finditer(line)
+        ]
+    )
+
+
+def iter_lines_from_input(input_data: TextIOBase) -> Generator[Line]:
+    for line in input_data:
+        yield get_line_from_string(line)
+
+
+def iter_lines_from_mapped_input(input_data: MappedInput) -> Generator[Line]:
+    for line in input_data.iter_lines():
+        yield get_line_from_bytes(line)
+
+
+def get_schematic_from_input(input_data: TextIOBase) -> Schematic:
+    return Schematic(lines=list(iter_lines_from_input(input_data)))
+
+
+def get_schematic_from_mapped_input(input_data: MappedInput) -> Schematic:
+    return Schematic(lines=list(iter_lines_from_mapped_input(input_data)))
+
+
+def get_bitmask_schematic_from_input(input_data: TextIOBase) -> BitmaskSchematic:
+    return BitmaskSchematic(rows=[BitmaskRow.from_string(line) for line in input_data])
+
+
+def get_bitmask_schematic_from_mapped_input(input_data: MappedInput) -> BitmaskSchematic:
+    return BitmaskSchematic(rows=[BitmaskRow.from_string(bytes(line).decode()) for line in input_data.iter_lines()])
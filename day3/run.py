@@ -1,13 +1,38 @@
 #!/usr/bin/env python
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
+from collections.abc import Iterable
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from day3.parser import get_schematic_from_input
+from aoc.profiling import phase
+from aoc.reader import MappedInput
+from day3.bands import BAND_SIZE, get_total_from_bands
+from day3.parser import (
+    get_bitmask_schematic_from_input,
+    get_bitmask_schematic_from_mapped_input,
+    get_schematic_from_input,
+    get_schematic_from_mapped_input,
+    iter_lines_from_input,
+    iter_lines_from_mapped_input,
+)
+from day3.schematic import Line, iter_gear_ratios, iter_part_numbers
+
+
+class SchematicArgumentParser(ArgumentParser):
+    def parse_known_args(
+        self,
+        args: list[str] | None = None,
+        namespace: Namespace | None = None,
+    ) -> tuple[Namespace, list[str]]:
+        options, extra_arguments = super().parse_known_args(args, namespace)
+        if options.backend == "bitmask" and (options.stream or options.jobs is not None):
+            self.error("--backend bitmask cannot be combined with --stream or -j/--jobs")
+        return options, extra_arguments
 
-parser = ArgumentParser()
+
+parser = SchematicArgumentParser()
 parser.add_argument(
     "data",
     type=open,
@@ -16,11 +41,62 @@ parser.add_argument(
     "-m", "--mode",
     choices=["part-numbers", "gear-ratios"]
 )
+parser.add_argument(
+    "--mmap",
+    action="store_true",
+)
+parser.add_argument(
+    "--stream",
+    action="store_true",
+)
+parser.add_argument(
+    "--backend",
+    choices=["elements", "bitmask"],
+    default="elements",
+)
+parser.add_argument(
+    "-j", "--jobs",
+    type=int,
+)
+parser.add_argument(
+    "--band-size",
+    type=int,
+    default=BAND_SIZE,
+)
+
+
+def get_total(lines: Iterable[Line], mode: str) -> int:
+    if mode == "part-numbers":
+        return sum(iter_part_numbers(lines))
+    return sum(iter_gear_ratios(lines))
+
+
+def solve(args: Namespace) -> int:
+    if args.backend == "bitmask":
+        with phase("parse"):
+            if args.mmap:
+                with MappedInput(args.data.name) as input_data:
+                    schematic = get_bitmask_schematic_from_mapped_input(input_data)
+            else:
+                schematic = get_bitmask_schematic_from_input(args.data)
+        if args.mode == "part-numbers":
+            return sum(schematic.get_part_numbers())
+        return sum(schematic.get_gear_ratios())
+    if args.jobs is not None:
+        return get_total_from_bands(args.data.name, args.mode, args.band_size, args.jobs)
+    if args.stream:
+        if args.mmap:
+            with MappedInput(args.data.name) as input_data:
+                return get_total(iter_lines_from_mapped_input(input_data), args.mode)
+        return get_total(iter_lines_from_input(args.data), args.mode)
+    with phase("parse"):
+        if args.mmap:
+            with MappedInput(args.data.name) as input_data:
+                schematic = get_schematic_from_mapped_input(input_data)
+        else:
+            schematic = get_schematic_from_input(args.data)
+    return get_total(schematic.lines, args.mode)
+
 
 if __name__ == "__main__":
-    args = parser.parse_args()
-    schematic = get_schematic_from_input(args.data)
-    if args.mode == "part-numbers":
-        print(sum(schematic.get_part_numbers()))
-    else:
-        print(sum(schematic.get_gear_ratios()))
+    print(solve(parser.parse_args()))
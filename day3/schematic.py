@@ -1,4 +1,5 @@
-from collections.abc import Generator
+from bisect import bisect_left, bisect_right
+from collections.abc import Generator, Iterable
 from dataclasses import dataclass
 from enum import Enum, auto
 from functools import cached_property
@@ -36,88 +37,102 @@ class Line:
             return self.elements[-1].start + len(self.elements[-1].value)
         return 0
 
+    @cached_property
+    def starts(self) -> list[int]:
+        return [element.start for element in self.elements]
+
+    @cached_property
+    def stops(self) -> list[int]:
+        return [element.range.stop for element in self.elements]
+
     def get_elements_in_range(self, check_range: range) -> list[Element]:
-        elements: list[Element] = []
-        for element in self.elements:
-            if element.start > check_range.stop:
-                break
-            if (
-                element.start <= check_range.start < element.range.stop
-            ) or (
-                check_range.start <= element.start < check_range.stop
-            ):
-                elements.append(element)
-        return elements
+        return self.elements[
+            bisect_right(self.stops, check_range.start):bisect_left(self.starts, check_range.stop)
+        ]
 
     def get_data_types_in_range(self, check_range: range) -> set[DataType]:
         return set(element.data_type for element in self.get_elements_in_range(check_range))
 
+    def get_part_numbers(self, previous_line: "Line | None", next_line: "Line | None") -> Generator[int]:
+        for element in self.elements:
+            if element.data_type is DataType.NUMBER:
+                is_part_number = False
+                adjacency_range = range(element.start - 1 if element.start else 0, element.range.stop + 1)
+                if previous_line is not None:
+                    is_part_number = DataType.SYMBOL in previous_line.get_data_types_in_range(adjacency_range)
+                if not is_part_number and next_line is not None:
+                    is_part_number = DataType.SYMBOL in next_line.get_data_types_in_range(adjacency_range)
+                if not is_part_number and element.start > 0:
+                    is_part_number = DataType.SYMBOL in self.get_data_types_in_range(
+                        range(element.start - 1, element.start)
+                    )
+                if not is_part_number:
+                    is_part_number = DataType.SYMBOL in self.get_data_types_in_range(
+                        range(element.range.stop, element.range.stop + 1)
+                    )
+                if is_part_number:
+                    yield int(element.value)
 
-@dataclass
-class Schematic:
-    lines: list[Line]
-
-    def get_part_numbers(self) -> Generator[int]:
-        for line_number, line in enumerate(self.lines):
-            for element in line.elements:
-                if element.data_type is DataType.NUMBER:
-                    is_part_number = False
-                    adjacency_range = range(element.start - 1 if element.start else 0, element.range.stop + 1)
-                    if line_number > 0:
-                        is_part_number = DataType.SYMBOL in self.lines[line_number - 1].get_data_types_in_range(
-                            adjacency_range
-                        )
-                    if not is_part_number and line_number < len(self.lines) - 1:
-                        is_part_number = DataType.SYMBOL in self.lines[line_number + 1].get_data_types_in_range(
-                            adjacency_range
-                        )
-                    if not is_part_number and element.start > 0:
-                        is_part_number = DataType.SYMBOL in line.get_data_types_in_range(
-                            range(element.start - 1, element.start)
-                        )
-                    if not is_part_number:
-                        is_part_number = DataType.SYMBOL in line.get_data_types_in_range(
-                            range(element.range.stop, element.range.stop + 1)
-                        )
-                    if is_part_number:
-                        yield int(element.value)
-
-    def get_gear_ratios(self) -> Generator[int]:
-        for line_number, line in enumerate(self.lines):
-            for element in line.elements:
-                if element.is_gear:
-                    adjacent_numbers: list[int] = []
-                    adjacency_range = range(element.start - 1 if element.start else 0, element.range.stop + 1)
-                    if line_number > 0:
-                        adjacent_numbers.extend(
-                            [
-                                int(element.value)
-                                for element in self.lines[line_number - 1].get_elements_in_range(adjacency_range)
-                                if element.data_type is DataType.NUMBER
-                            ]
-                        )
-                    if line_number < len(self.lines) - 1:
-                        adjacent_numbers.extend(
-                            [
-                                int(element.value)
-                                for element in self.lines[line_number + 1].get_elements_in_range(adjacency_range)
-                                if element.data_type is DataType.NUMBER
-                            ]
-                        )
-                    if element.start > 0:
+    def get_gear_ratios(self, previous_line: "Line | None", next_line: "Line | None") -> Generator[int]:
+        for element in self.elements:
+            if element.is_gear:
+                adjacent_numbers: list[int] = []
+                adjacency_range = range(element.start - 1 if element.start else 0, element.range.stop + 1)
+                for adjacent_line in (previous_line, next_line):
+                    if adjacent_line is not None:
                         adjacent_numbers.extend(
                             [
                                 int(element.value)
-                                for element in line.get_elements_in_range(range(element.start - 1, element.start))
+                                for element in adjacent_line.get_elements_in_range(adjacency_range)
                                 if element.data_type is DataType.NUMBER
                             ]
                         )
+                if element.start > 0:
                     adjacent_numbers.extend(
                         [
                             int(element.value)
-                            for element in line.get_elements_in_range(range(element.range.stop, element.range.stop + 1))
+                            for element in self.get_elements_in_range(range(element.start - 1, element.start))
                             if element.data_type is DataType.NUMBER
                         ]
                     )
-                    if len(adjacent_numbers) == 2:
-                        yield adjacent_numbers[0] * adjacent_numbers[1]
+                adjacent_numbers.extend(
+                    [
+                        int(element.value)
+                        for element in self.get_elements_in_range(range(element.range.stop, element.range.stop + 1))
+                        if element.data_type is DataType.NUMBER
+                    ]
+                )
+                if len(adjacent_numbers) == 2:
+                    yield adjacent_numbers[0] * adjacent_numbers[1]
+
+
+def iter_windows(lines: Iterable[Line]) -> Generator[tuple[Line | None, Line, Line | None]]:
+    previous_line: Line | None = None
+    current_line: Line | None = None
+    for next_line in lines:
+        if current_line is not None:
+            yield previous_line, current_line, next_line
+        previous_line, current_line = current_line, next_line
+    if current_line is not None:
+        yield previous_line, current_line, None
+
+
+def iter_part_numbers(lines: Iterable[Line]) -> Generator[int]:
+    for previous_line, line, next_line in iter_windows(lines):
+        yield from line.get_part_numbers(previous_line, next_line)
+
+
+def iter_gear_ratios(lines: Iterable[Line]) -> Generator[int]:
+    for previous_line, line, next_line in iter_windows(lines):
+        yield from line.get_gear_ratios(previous_line, next_line)
+
+
+@dataclass
+class Schematic:
+    lines: list[Line]
+
+    def get_part_numbers(self) -> Generator[int]:
+        return iter_part_numbers(self.lines)
+
+    def get_gear_ratios(self) -> Generator[int]:
+        return iter_gear_ratios(self.lines)
@@ -1,8 +1,19 @@
 from io import StringIO
 from unittest import TestCase
 
-from .parser import get_schematic_from_input
-from .schematic import DataType, Element, Line, Schematic
+from aoc.testing import mapped_input
+
+from .bands import get_band_total, get_total_from_bands
+from .bitmask import BitmaskRow
+from .parser import (
+    get_bitmask_schematic_from_input,
+    get_bitmask_schematic_from_mapped_input,
+    get_schematic_from_input,
+    get_schematic_from_mapped_input,
+    iter_lines_from_input,
+    iter_lines_from_mapped_input,
+)
+from .schematic import DataType, Element, Line, Schematic, iter_gear_ratios, iter_part_numbers, iter_windows
 
 
 class ParserTestCase(TestCase):
@@ -84,6 +95,23 @@ class ParserTestCase(TestCase):
                 line, actual.lines[line_number], msg=f"Expectation failed at line {line_number + 1}"
             )
 
+    def test_get_schematic_from_mapped_input(self):
+        input_data = """467..114..
+...*......
+..35..633.
+......#...
+617*$1....
+.....+.58.
+..592.....
+......755.
+...$.*....
+.664.598.."""
+        with mapped_input(input_data) as mapped_input_data:
+            self.assertEqual(
+                get_schematic_from_mapped_input(mapped_input_data),
+                get_schematic_from_input(StringIO(input_data))
+            )
+
 
 class ElementTestCase(TestCase):
     def test_data_type(self):
@@ -162,6 +190,18 @@ class LineTestCase(TestCase):
             ]
         )
 
+    def test_element_bounds(self):
+        line = Line(
+            elements=[
+                Element(start=2, value="123"),
+                Element(start=6, value="90"),
+                Element(start=10, value="$"),
+            ]
+        )
+        self.assertEqual(line.starts, [2, 6, 10])
+        self.assertEqual(line.stops, [5, 8, 11])
+        self.assertEqual(Line(elements=[]).get_elements_in_range(range(0, 3)), [])
+
     def test_get_data_types_in_range(self):
         line = Line(
             elements=[
@@ -237,6 +277,44 @@ class SchematicTestCase(TestCase):
             ]
         )
 
+    def test_streaming(self):
+        input_data = """467..114..
+...*......
+..35..633.
+......#...
+617*......
+.....+.58.
+..592.....
+......755.
+...$.*....
+.664.598.."""
+        self.assertEqual(
+            list(iter_part_numbers(iter_lines_from_input(StringIO(input_data)))),
+            list(self.schematic.get_part_numbers()),
+        )
+        self.assertEqual(
+            list(iter_gear_ratios(iter_lines_from_input(StringIO(input_data)))),
+            list(self.schematic.get_gear_ratios()),
+        )
+        with mapped_input(input_data) as mapped_data:
+            self.assertEqual(
+                list(iter_part_numbers(iter_lines_from_mapped_input(mapped_data))),
+                list(self.schematic.get_part_numbers()),
+            )
+
+    def test_iter_windows(self):
+        lines = [Line(elements=[Element(start=0, value=str(i))]) for i in range(3)]
+        self.assertEqual(
+            list(iter_windows(iter(lines))),
+            [
+                (None, lines[0], lines[1]),
+                (lines[0], lines[1], lines[2]),
+                (lines[1], lines[2], None),
+            ]
+        )
+        self.assertEqual(list(iter_windows(iter(lines[:1]))), [(None, lines[0], None)])
+        self.assertEqual(list(iter_windows(iter([]))), [])
+
     def test_get_gear_ratios_2(self):
         schematic = get_schematic_from_input(StringIO("""467..114..
 ...*......
@@ -284,3 +362,68 @@ class SchematicTestCase(TestCase):
                 218 * 254,
             ]
         )
+
+
+class BitmaskSchematicTestCase(TestCase):
+    def setUp(self):
+        self.input_data = """467..114..
+...*......
+..35..633.
+......#...
+617*23....
+...*.+.58.
+..592.....
+......755.
+...$.**...
+.664.598.."""
+
+    def test_row_from_string(self):
+        row = BitmaskRow.from_string("617*23.#*$..\n")
+        self.assertEqual(row.symbol_mask, 0b1110001000)
+        self.assertEqual(row.gears, [3])
+        self.assertEqual(row.number_values, [617, 23])
+        self.assertEqual(row.get_numbers_in_range(2, 5), [617, 23])
+        self.assertEqual(row.get_numbers_in_range(6, 9), [])
+
+    def test_matches_elements_backend(self):
+        schematic = get_schematic_from_input(StringIO(self.input_data))
+        bitmask_schematic = get_bitmask_schematic_from_input(StringIO(self.input_data))
+        self.assertEqual(list(bitmask_schematic.get_part_numbers()), list(schematic.get_part_numbers()))
+        self.assertEqual(list(bitmask_schematic.get_gear_ratios()), list(schematic.get_gear_ratios()))
+        with mapped_input(self.input_data) as mapped_data:
+            bitmask_schematic = get_bitmask_schematic_from_mapped_input(mapped_data)
+        self.assertEqual(list(bitmask_schematic.get_part_numbers()), list(schematic.get_part_numbers()))
+
+
+class BandTestCase(TestCase):
+    def setUp(self):
+        self.input_data = """467..114..
+...*......
+..35..633.
+......#...
+617*......
+.....+.58.
+..592.....
+......755.
+...$.*....
+.664.598..
+"""
+
+    def test_get_band_total(self):
+        with mapped_input(self.input_data) as input_data:
+            offsets = input_data.get_chunk_offsets(25)
+            self.assertEqual(
+                sum(get_band_total(input_data.path, start, end, "part-numbers") for start, end in offsets),
+                4361
+            )
+            self.assertEqual(
+                sum(get_band_total(input_data.path, start, end, "gear-ratios") for start, end in offsets),
+                467835
+            )
+
+    def test_get_total_from_bands(self):
+        with mapped_input(self.input_data) as input_data:
+            for band_size in (1, 15, 1000):
+                with self.subTest(band_size=band_size):
+                    self.assertEqual(get_total_from_bands(input_data.path, "part-numbers", band_size, 2), 4361)
+                    self.assertEqual(get_total_from_bands(input_data.path, "gear-ratios", band_size, 2), 467835)
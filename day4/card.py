@@ -1,3 +1,5 @@
+from array import array
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from functools import cached_property
 
@@ -21,6 +23,81 @@ class Card:
         return 2 ** (self.match_count - 1) if self.match_count else 0
 
 
+@dataclass(slots=True)
+class BitmaskCard:
+    id: int
+    winning_mask: int = 0
+    number_mask: int = 0
+
+    @property
+    def match_count(self) -> int:
+        return (self.winning_mask & self.number_mask).bit_count()
+
+    @property
+    def value(self) -> int:
+        return 1 << (self.match_count - 1) if self.match_count else 0
+
+
+@dataclass
+class CardMatrix:
+    winning_width: int = 0
+    number_width: int = 0
+    ids: array = field(default_factory=lambda: array("q"))
+    winning_numbers: array = field(default_factory=lambda: array("H"))
+    numbers: array = field(default_factory=lambda: array("H"))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, card_id: int, winning_numbers: Sequence[int], numbers: Sequence[int]):
+        if not self.ids:
+            self.winning_width = len(winning_numbers)
+            self.number_width = len(numbers)
+        elif len(winning_numbers) != self.winning_width or len(numbers) != self.number_width:
+            raise ValueError(
+                f"Card {card_id} has {len(winning_numbers)} winning numbers and {len(numbers)} numbers, "
+                f"expected {self.winning_width} and {self.number_width}"
+            )
+        self.ids.append(card_id)
+        self.winning_numbers.extend(winning_numbers)
+        self.numbers.extend(numbers)
+
+    def get_match_counts(self) -> array:
+        winning_width = self.winning_width
+        number_width = self.number_width
+        return array(
+            "q",
+            (
+                len(
+                    set(self.winning_numbers[idx * winning_width:(idx + 1) * winning_width]).intersection(
+                        self.numbers[idx * number_width:(idx + 1) * number_width]
+                    )
+                )
+                for idx in range(len(self.ids))
+            )
+        )
+
+    def get_total_value(self) -> int:
+        return sum(1 << (match_count - 1) for match_count in self.get_match_counts() if match_count)
+
+    def get_copy_counts(self) -> list[int]:
+        return get_card_copy_counts(self.get_match_counts())
+
+
 def set_winnings(cards: list[Card]):
     for idx, card in enumerate(cards):
         card.won_cards.extend(cards[idx+1:idx+1+card.match_count])
+
+
+def get_card_copy_counts(match_counts: Sequence[int]) -> list[int]:
+    copy_counts: list[int] = []
+    pending_changes = [0] * (len(match_counts) + 1)
+    won_copies = 0
+    for idx, match_count in enumerate(match_counts):
+        won_copies += pending_changes[idx]
+        copy_count = 1 + won_copies
+        copy_counts.append(copy_count)
+        if match_count:
+            pending_changes[idx + 1] += copy_count
+            pending_changes[min(idx + 1 + match_count, len(match_counts))] -= copy_count
+    return copy_counts
@@ -1,20 +1,47 @@
 from collections.abc import Generator
 from io import TextIOBase
 
-from .card import Card
+from .card import BitmaskCard, Card, CardMatrix
 
 
 def get_numbers_from_flat_list(number_list: str) -> set[int]:
     return set(int(number) for number in number_list.split(" ") if len(number))
 
 
-def get_cards_from_input(input_data: TextIOBase) -> Generator[Card]:
+def get_mask_from_flat_list(number_list: str) -> int:
+    mask = 0
+    for number in number_list.split():
+        mask |= 1 << int(number)
+    return mask
+
+
+def get_cards_from_input(input_data: TextIOBase, as_bitmask: bool = False) -> Generator[Card | BitmaskCard]:
     for line in input_data:
         card_name, _, all_numbers = line.strip().partition(":")
         _, _, card_id = card_name.partition(" ")
         winning_numbers, _, numbers = all_numbers.strip().partition("|")
-        yield Card(
-            id=int(card_id),
-            winning_numbers=get_numbers_from_flat_list(winning_numbers),
-            numbers=get_numbers_from_flat_list(numbers)
+        if as_bitmask:
+            yield BitmaskCard(
+                id=int(card_id),
+                winning_mask=get_mask_from_flat_list(winning_numbers),
+                number_mask=get_mask_from_flat_list(numbers),
+            )
+        else:
+            yield Card(
+                id=int(card_id),
+                winning_numbers=get_numbers_from_flat_list(winning_numbers),
+                numbers=get_numbers_from_flat_list(numbers)
+            )
+
+
+def get_card_matrix_from_input(input_data: TextIOBase) -> CardMatrix:
+    matrix = CardMatrix()
+    for line in input_data:
+        card_name, _, all_numbers = line.partition(":")
+        winning_numbers, _, numbers = all_numbers.partition("|")
+        matrix.append(
+            int(card_name.split()[1]),
+            [int(number) for number in winning_numbers.split()],
+            [int(number) for number in numbers.split()],
         )
+    return matrix
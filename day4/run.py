@@ -1,12 +1,13 @@
 #!/usr/bin/env python
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from day4.card import set_winnings
-from day4.parser import get_cards_from_input
+from aoc.profiling import phase
+from day4.card import get_card_copy_counts
+from day4.parser import get_card_matrix_from_input, get_cards_from_input
 
 parser = ArgumentParser()
 parser.add_argument(
@@ -17,12 +18,29 @@ parser.add_argument(
     "-m", "--mode",
     choices=["total-value", "count-winnings"]
 )
+parser.add_argument(
+    "--bitmask",
+    action="store_true",
+)
+parser.add_argument(
+    "--matrix",
+    action="store_true",
+)
 
-if __name__ == "__main__":
-    args = parser.parse_args()
-    cards = list(get_cards_from_input(args.data))
+
+def solve(args: Namespace) -> int:
+    if args.matrix:
+        with phase("parse"):
+            matrix = get_card_matrix_from_input(args.data)
+        if args.mode == "total-value":
+            return matrix.get_total_value()
+        return sum(matrix.get_copy_counts())
+    with phase("parse"):
+        cards = list(get_cards_from_input(args.data, args.bitmask))
     if args.mode == "total-value":
-        print(sum(card.value for card in cards))
-    else:
-        set_winnings(cards)
-        print(sum(len(card) for card in cards))
+        return sum(card.value for card in cards)
+    return sum(get_card_copy_counts([card.match_count for card in cards]))
+
+
+if __name__ == "__main__":
+    print(solve(parser.parse_args()))
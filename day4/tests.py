@@ -1,8 +1,8 @@
 from io import StringIO
 from unittest import TestCase
 
-from .card import Card, set_winnings
-from .parser import get_cards_from_input
+from .card import BitmaskCard, Card, CardMatrix, get_card_copy_counts, set_winnings
+from .parser import get_card_matrix_from_input, get_cards_from_input
 
 class CardTestCase(TestCase):
     def test_get_value(self):
@@ -68,6 +68,12 @@ class CardTestCase(TestCase):
         set_winnings(cards)
         self.assertEqual(sum(len(card) for card in cards), 30)
 
+    def test_get_card_copy_counts(self):
+        self.assertEqual(get_card_copy_counts([4, 2, 2, 1, 0, 0]), [1, 2, 4, 8, 14, 1])
+        self.assertEqual(get_card_copy_counts([3, 3, 0]), [1, 2, 4])
+        self.assertEqual(get_card_copy_counts([]), [])
+        self.assertEqual(sum(get_card_copy_counts([1] * 100000)), 100000 * 100001 // 2)
+
 
 class ParserTestCase(TestCase):
     def test_get_cards_from_input(self):
@@ -88,3 +94,44 @@ Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11""")
                 Card(id=6, winning_numbers={31, 18, 13, 56, 72}, numbers={74, 77, 10, 23, 35, 67, 36, 11})
             ]
         )
+
+    def test_get_bitmask_cards_from_input(self):
+        input_data = StringIO("""Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
+Card 2: 13 32 20 16 61 | 61 30 68 82 17 32 24 19
+Card 3:  1 21 53 59 44 | 69 82 63 72 16 21 14  1
+Card 4: 41 92 73 84 69 | 59 84 76 51 58  5 54 83
+Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36
+Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11""")
+        cards = list(get_cards_from_input(input_data, as_bitmask=True))
+        self.assertIsInstance(cards[0], BitmaskCard)
+        self.assertEqual(cards[2].winning_mask, (1 << 1) | (1 << 21) | (1 << 53) | (1 << 59) | (1 << 44))
+        self.assertEqual([card.match_count for card in cards], [4, 2, 2, 1, 0, 0])
+        self.assertEqual([card.value for card in cards], [8, 2, 2, 1, 0, 0])
+        self.assertEqual(sum(get_card_copy_counts([card.match_count for card in cards])), 30)
+
+
+class CardMatrixTestCase(TestCase):
+    def setUp(self):
+        self.matrix = get_card_matrix_from_input(StringIO("""Card 1: 41 48 83 86 17 | 83 86  6 31 17  9 48 53
+Card 2: 13 32 20 16 61 | 61 30 68 82 17 32 24 19
+Card 3:  1 21 53 59 44 | 69 82 63 72 16 21 14  1
+Card 4: 41 92 73 84 69 | 59 84 76 51 58  5 54 83
+Card 5: 87 83 26 28 32 | 88 30 70 12 93 22 82 36
+Card 6: 31 18 13 56 72 | 74 77 10 23 35 67 36 11"""))
+
+    def test_get_card_matrix_from_input(self):
+        self.assertEqual(len(self.matrix), 6)
+        self.assertEqual((self.matrix.winning_width, self.matrix.number_width), (5, 8))
+        self.assertEqual(list(self.matrix.ids), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(list(self.matrix.winning_numbers[10:15]), [1, 21, 53, 59, 44])
+
+    def test_scoring(self):
+        self.assertEqual(list(self.matrix.get_match_counts()), [4, 2, 2, 1, 0, 0])
+        self.assertEqual(self.matrix.get_total_value(), 13)
+        self.assertEqual(self.matrix.get_copy_counts(), [1, 2, 4, 8, 14, 1])
+
+    def test_ragged_rows(self):
+        matrix = CardMatrix()
+        matrix.append(1, [1, 2], [3, 4, 5])
+        with self.assertRaises(ValueError):
+            matrix.append(2, [1, 2, 3], [3, 4, 5])
@@ -1,5 +1,7 @@
-from collections.abc import Generator
-from functools import cached_property
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Generator, Iterable
+from dataclasses import dataclass, field
 
 
 def find_range_index(key: int, range_container: list[range]) -> int:
@@ -9,6 +11,22 @@ def find_range_index(key: int, range_container: list[range]) -> int:
     raise ValueError
 
 
+def find_sorted_range_index(key: int, starts: list[int], indices: list[int], range_container: list[range]) -> int:
+    position = bisect_right(starts, key) - 1
+    if position >= 0 and key < range_container[indices[position]].stop:
+        return indices[position]
+    raise ValueError
+
+
+def get_insertion_index(range_obj: range, starts: list[int], indices: list[int], range_container: list[range]) -> int:
+    position = bisect_left(starts, range_obj.start)
+    if position > 0 and range_container[indices[position - 1]].stop > range_obj.start:
+        raise ValueError
+    if position < len(starts) and starts[position] < range_obj.stop:
+        raise ValueError
+    return position
+
+
 def get_intersections(source: list[range], target: list[range]) -> list[range]:
     intersections: list[range] = []
     target = sorted(target, key=lambda range_obj: range_obj.start)
@@ -27,6 +45,24 @@ def get_intersections(source: list[range], target: list[range]) -> list[range]:
     return intersections
 
 
+def get_differences(source: list[range], target: list[range]) -> list[range]:
+    differences: list[range] = []
+    target = sorted(target, key=lambda range_obj: range_obj.start)
+    for range_obj in source:
+        start = range_obj.start
+        for candidate in target:
+            if candidate.start >= range_obj.stop:
+                break
+            if candidate.stop <= start:
+                continue
+            if candidate.start > start:
+                differences.append(range(start, candidate.start))
+            start = max(start, candidate.stop)
+        if start < range_obj.stop:
+            differences.append(range(start, range_obj.stop))
+    return differences
+
+
 
 class RangeSet:
     def __init__(self, source_category: str, destination_category: str):
@@ -34,63 +70,185 @@ class RangeSet:
         self.destination_category = destination_category
         self.source_ranges: list[range] = []
         self.destination_ranges: list[range] = []
+        self.source_starts: list[int] = []
+        self.source_indices: list[int] = []
+        self.destination_starts: list[int] = []
+        self.destination_indices: list[int] = []
+        self.version = 0
 
     def get_mapped_value(self, key: int, reverse: bool = False) -> int:
         if reverse:
             range_container, other_range_container = self.destination_ranges, self.source_ranges
+            starts, indices = self.destination_starts, self.destination_indices
         else:
             range_container, other_range_container = self.source_ranges, self.destination_ranges
+            starts, indices = self.source_starts, self.source_indices
         try:
-            range_index = find_range_index(key, range_container)
+            range_index = find_sorted_range_index(key, starts, indices, range_container)
         except ValueError:
             return key
         offset = key - range_container[range_index].start
         return other_range_container[range_index].start + offset
 
+    def get_mapped_ranges(self, ranges: list[range]) -> list[range]:
+        mapped_ranges: list[range] = []
+        for intersection in get_intersections(ranges, self.source_ranges):
+            range_index = self.find_source_range_index(intersection.start)
+            offset = self.destination_ranges[range_index].start - self.source_ranges[range_index].start
+            mapped_ranges.append(range(intersection.start + offset, intersection.stop + offset))
+        mapped_ranges.extend(get_differences(ranges, self.source_ranges))
+        return mapped_ranges
+
     def find_source_range_index(self, key: int) -> int:
         try:
-            return find_range_index(key, self.source_ranges)
+            return find_sorted_range_index(key, self.source_starts, self.source_indices, self.source_ranges)
         except ValueError:
             raise ValueError(f"No suitable {self.source_category} range found for key {key}")
 
     def find_destination_range_index(self, key: int) -> int:
         try:
-            return find_range_index(key, self.destination_ranges)
+            return find_sorted_range_index(
+                key, self.destination_starts, self.destination_indices, self.destination_ranges
+            )
         except ValueError:
             raise ValueError(f"No suitable {self.destination_category} range found for key {key}")
 
     def add_range(self, destination_start: int, source_start: int, length: int):
-        self.source_ranges.append(range(source_start, source_start + length))
-        self.destination_ranges.append(range(destination_start, destination_start + length))
-
-    @cached_property
+        source_range = range(source_start, source_start + length)
+        destination_range = range(destination_start, destination_start + length)
+        if length > 0:
+            try:
+                source_position = get_insertion_index(
+                    source_range, self.source_starts, self.source_indices, self.source_ranges
+                )
+            except ValueError:
+                raise ValueError(f"{self.source_category} range {source_range} overlaps an existing range")
+            try:
+                destination_position = get_insertion_index(
+                    destination_range, self.destination_starts, self.destination_indices, self.destination_ranges
+                )
+            except ValueError:
+                raise ValueError(f"{self.destination_category} range {destination_range} overlaps an existing range")
+            self.source_starts.insert(source_position, source_start)
+            self.source_indices.insert(source_position, len(self.source_ranges))
+            self.destination_starts.insert(destination_position, destination_start)
+            self.destination_indices.insert(destination_position, len(self.destination_ranges))
+        self.source_ranges.append(source_range)
+        self.destination_ranges.append(destination_range)
+        self.version += 1
+
+    @property
     def sorted_destination_range_indices(self) -> list[int]:
-        destination_ranges = list(enumerate(self.destination_ranges))
-        destination_ranges.sort(key=lambda pair: pair[1].start)
-        return [pair[0] for pair in destination_ranges]
+        return list(self.destination_indices)
+
+
+@dataclass
+class PiecewiseMapping:
+    starts: list[int] = field(default_factory=list)
+    offsets: list[int] = field(default_factory=list)
+
+    @classmethod
+    def from_breakpoints(cls, breakpoints: dict[int, int]) -> "PiecewiseMapping":
+        mapping = cls()
+        previous_offset = 0
+        for start in sorted(breakpoints):
+            if breakpoints[start] != previous_offset:
+                mapping.starts.append(start)
+                mapping.offsets.append(breakpoints[start])
+                previous_offset = breakpoints[start]
+        return mapping
+
+    @classmethod
+    def from_range_set(cls, range_set: RangeSet, reverse: bool = False) -> "PiecewiseMapping":
+        if reverse:
+            range_container, other_range_container = range_set.destination_ranges, range_set.source_ranges
+        else:
+            range_container, other_range_container = range_set.source_ranges, range_set.destination_ranges
+        pairs = [
+            (range_obj, other_range_obj)
+            for range_obj, other_range_obj in zip(range_container, other_range_container)
+            if range_obj
+        ]
+        breakpoints: dict[int, int] = {}
+        for range_obj, _ in pairs:
+            breakpoints[range_obj.stop] = 0
+        for range_obj, other_range_obj in pairs:
+            breakpoints[range_obj.start] = other_range_obj.start - range_obj.start
+        return cls.from_breakpoints(breakpoints)
+
+    def get_offset(self, key: int) -> int:
+        index = bisect_right(self.starts, key) - 1
+        return self.offsets[index] if index >= 0 else 0
+
+    def get_mapped_value(self, key: int) -> int:
+        return key + self.get_offset(key)
+
+    def get_mapped_values(self, values: Iterable[int]) -> array:
+        starts = self.starts
+        offsets = [0, *self.offsets]
+        return array("q", [value + offsets[bisect_right(starts, value)] for value in values])
+
+    def compose(self, other: "PiecewiseMapping") -> "PiecewiseMapping":
+        breakpoints = set(self.starts)
+        lower_bounds: list[int | None] = [None, *self.starts]
+        upper_bounds: list[int | None] = [*self.starts, None]
+        for lower_bound, upper_bound, offset in zip(lower_bounds, upper_bounds, [0, *self.offsets]):
+            first_index = 0 if lower_bound is None else bisect_right(other.starts, lower_bound + offset)
+            last_index = len(other.starts) if upper_bound is None else bisect_left(other.starts, upper_bound + offset)
+            breakpoints.update(start - offset for start in other.starts[first_index:last_index])
+        return PiecewiseMapping.from_breakpoints({
+            start: self.get_offset(start) + other.get_offset(self.get_mapped_value(start))
+            for start in breakpoints
+        })
 
 
 class RangeSetOrchestrator:
     def __init__(self):
         self.lookup_table: dict[str, RangeSet] = {}
         self.lookup_table_by_destination: dict[str, RangeSet] = {}
+        self.composed_mappings: dict[tuple[str, bool], tuple[tuple[int, ...], PiecewiseMapping]] = {}
 
     def add_range_set(self, range_set: RangeSet):
         self.lookup_table[range_set.source_category] = range_set
         self.lookup_table_by_destination[range_set.destination_category] = range_set
+        self.composed_mappings.clear()
+
+    def get_range_set_chain(self, category: str, reverse: bool = False) -> list[RangeSet]:
+        lookup_table = self.lookup_table_by_destination if reverse else self.lookup_table
+        range_sets: list[RangeSet] = []
+        while category in lookup_table:
+            range_set = lookup_table[category]
+            range_sets.append(range_set)
+            category = range_set.source_category if reverse else range_set.destination_category
+        return range_sets
+
+    def get_composed_mapping(self, category: str, reverse: bool = False) -> PiecewiseMapping:
+        range_sets = self.get_range_set_chain(category, reverse)
+        versions = tuple(range_set.version for range_set in range_sets)
+        if (category, reverse) in self.composed_mappings:
+            cached_versions, mapping = self.composed_mappings[category, reverse]
+            if cached_versions == versions:
+                return mapping
+        mapping = PiecewiseMapping()
+        for range_set in range_sets:
+            mapping = mapping.compose(PiecewiseMapping.from_range_set(range_set, reverse=reverse))
+        self.composed_mappings[category, reverse] = (versions, mapping)
+        return mapping
 
     def get_mapped_value(self, key: int, source_category: str) -> int:
+        return self.get_composed_mapping(source_category).get_mapped_value(key)
+
+    def get_mapped_ranges(self, ranges: list[range], source_category: str) -> list[range]:
         range_set: RangeSet
+        ranges = [range_obj for range_obj in ranges if range_obj]
         while source_category in self.lookup_table:
             range_set = self.lookup_table[source_category]
-            key = range_set.get_mapped_value(key)
+            ranges = range_set.get_mapped_ranges(ranges)
             source_category = range_set.destination_category
-        return key
+        return ranges
+
+    def get_mapped_values(self, values: Iterable[int], source_category: str) -> array:
+        return self.get_composed_mapping(source_category).get_mapped_values(values)
 
     def get_reverse_mapped_value(self, key: int, destination_category: str) -> int:
-        range_set: RangeSet
-        while destination_category in self.lookup_table_by_destination:
-            range_set = self.lookup_table_by_destination[destination_category]
-            key = range_set.get_mapped_value(key, reverse=True)
-            destination_category = range_set.source_category
-        return key
+        return self.get_composed_mapping(destination_category, reverse=True).get_mapped_value(key)
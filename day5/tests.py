@@ -1,7 +1,8 @@
+from array import array
 from io import StringIO
 from unittest import TestCase
 
-from .mapping import RangeSet, RangeSetOrchestrator, find_range_index, get_intersections
+from .mapping import PiecewiseMapping, RangeSet, RangeSetOrchestrator, find_range_index, get_differences, get_intersections
 from .parser import get_seeds_and_orchestrator_from_input, get_seed_ranges_and_orchestrator_from_input
 
 
@@ -43,6 +44,31 @@ class RangeUtilsTestCase(TestCase):
             target
         )
 
+    def test_get_differences(self):
+        source = [
+            range(3, 6),
+            range(0, 2),
+            range(30, 33),
+            range(9, 15),
+        ]
+        target = [
+            range(20, 25),
+            range(1, 5),
+            range(10, 12),
+        ]
+        self.assertCountEqual(
+            get_differences(source, target),
+            [
+                range(5, 6),
+                range(0, 1),
+                range(30, 33),
+                range(9, 10),
+                range(12, 15),
+            ]
+        )
+        self.assertEqual(get_differences(source, [range(0, 33)]), [])
+        self.assertCountEqual(get_differences(source, []), source)
+
     def test_find_range_index(self):
         ranges = [
             range(2, 29),
@@ -75,6 +101,42 @@ class RangeSetTestCase(TestCase):
         self.assertEqual(range_set.get_mapped_value(55, reverse=True), 53)
         self.assertEqual(range_set.get_mapped_value(10, reverse=True), 10)
 
+    def test_get_mapped_ranges(self):
+        range_set = RangeSet("foo", "bar")
+        range_set.add_range(50, 98, 2)
+        range_set.add_range(52, 50, 48)
+        self.assertCountEqual(
+            range_set.get_mapped_ranges([range(40, 60), range(95, 105)]),
+            [range(40, 50), range(52, 62), range(97, 100), range(50, 52), range(100, 105)]
+        )
+
+    def test_find_range_indices(self):
+        range_set = RangeSet("foo", "bar")
+        range_set.add_range(52, 50, 48)
+        range_set.add_range(50, 98, 2)
+        range_set.add_range(0, 10, 5)
+        self.assertEqual(range_set.find_source_range_index(50), 0)
+        self.assertEqual(range_set.find_source_range_index(99), 1)
+        self.assertEqual(range_set.find_source_range_index(14), 2)
+        self.assertEqual(range_set.find_destination_range_index(51), 1)
+        self.assertEqual(range_set.find_destination_range_index(0), 2)
+        with self.assertRaises(ValueError):
+            range_set.find_source_range_index(15)
+        with self.assertRaises(ValueError):
+            range_set.find_destination_range_index(100)
+
+    def test_add_overlapping_range(self):
+        range_set = RangeSet("foo", "bar")
+        range_set.add_range(52, 50, 48)
+        with self.assertRaises(ValueError):
+            range_set.add_range(0, 97, 2)
+        with self.assertRaises(ValueError):
+            range_set.add_range(99, 0, 2)
+        with self.assertRaises(ValueError):
+            range_set.add_range(0, 40, 11)
+        range_set.add_range(50, 98, 2)
+        self.assertEqual(len(range_set.source_ranges), 2)
+
     def test_sorted_destination_range_indices(self):
         range_set = RangeSet("foo", "bar")
         range_set.add_range(52, 50, 48)
@@ -117,6 +179,55 @@ class RangeSetOrchestratorTestCase(TestCase):
             35
         )
 
+    def test_get_mapped_values(self):
+        seeds = array("q", range(0, 110))
+        self.assertEqual(
+            list(self.orchestrator.get_mapped_values(seeds, "seed")),
+            [self.orchestrator.get_mapped_value(seed, "seed") for seed in seeds]
+        )
+        self.assertEqual(list(self.orchestrator.get_mapped_values([79, 14, 55, 13], "seed")), [82, 43, 86, 35])
+        self.assertEqual(len(self.orchestrator.get_mapped_values([], "seed")), 0)
+
+    def test_get_composed_mapping(self):
+        mapping = self.orchestrator.get_composed_mapping("seed")
+        self.assertIs(self.orchestrator.get_composed_mapping("seed"), mapping)
+        for seed in range(0, 110):
+            key = seed
+            for category in ("seed", "soil", "fertilizer", "water", "light", "temperature", "humidity"):
+                key = self.orchestrator.lookup_table[category].get_mapped_value(key)
+            self.assertEqual(mapping.get_mapped_value(seed), key)
+            self.assertEqual(
+                self.orchestrator.get_reverse_mapped_value(key, "location"),
+                seed
+            )
+        self.orchestrator.add_range_set(RangeSet("location", "planet"))
+        self.assertNotIn(("seed", False), self.orchestrator.composed_mappings)
+
+    def test_add_range_after_lookup(self):
+        orchestrator = RangeSetOrchestrator()
+        range_set = RangeSet("seed", "location")
+        orchestrator.add_range_set(range_set)
+        range_set.add_range(50, 0, 10)
+        self.assertEqual(orchestrator.get_mapped_value(5, "seed"), 55)
+        self.assertEqual(orchestrator.get_reverse_mapped_value(105, "location"), 105)
+        self.assertEqual(range_set.version, 1)
+        range_set.add_range(100, 20, 10)
+        self.assertEqual(range_set.version, 2)
+        self.assertEqual(orchestrator.get_mapped_value(25, "seed"), 105)
+        self.assertEqual(orchestrator.get_reverse_mapped_value(105, "location"), 25)
+        self.assertEqual(list(orchestrator.get_mapped_values([5, 25], "seed")), [55, 105])
+
+    def test_get_mapped_ranges(self):
+        ranges = [range(79, 79 + 14), range(55, 55 + 13)]
+        location_ranges = self.orchestrator.get_mapped_ranges(ranges, "seed")
+        self.assertEqual(min(range_obj.start for range_obj in location_ranges), 46)
+        self.assertEqual(sum(len(range_obj) for range_obj in location_ranges), 27)
+        self.assertCountEqual(
+            [location_id for range_obj in location_ranges for location_id in range_obj],
+            [self.orchestrator.get_mapped_value(seed, "seed") for range_obj in ranges for seed in range_obj]
+        )
+        self.assertEqual(self.orchestrator.get_mapped_ranges([range(5, 5)], "seed"), [])
+
     def test_get_reverse_mapped_value(self):
         self.assertEqual(
             self.orchestrator.get_reverse_mapped_value(82, "location"),
@@ -152,6 +263,48 @@ class RangeSetOrchestratorTestCase(TestCase):
 
 
 
+class PiecewiseMappingTestCase(TestCase):
+    def setUp(self):
+        self.range_set = RangeSet("foo", "bar")
+        self.range_set.add_range(50, 98, 2)
+        self.range_set.add_range(52, 50, 48)
+
+    def test_from_range_set(self):
+        mapping = PiecewiseMapping.from_range_set(self.range_set)
+        self.assertEqual(mapping.starts, [50, 98, 100])
+        self.assertEqual(mapping.offsets, [2, -48, 0])
+        for key in range(0, 110):
+            self.assertEqual(mapping.get_mapped_value(key), self.range_set.get_mapped_value(key))
+        mapping = PiecewiseMapping.from_range_set(self.range_set, reverse=True)
+        for key in range(0, 110):
+            self.assertEqual(
+                mapping.get_mapped_value(key),
+                self.range_set.get_mapped_value(key, reverse=True)
+            )
+
+    def test_from_range_set_with_empty_range(self):
+        range_set = RangeSet("foo", "bar")
+        range_set.add_range(50, 0, 100)
+        range_set.add_range(500, 20, 0)
+        mapping = PiecewiseMapping.from_range_set(range_set)
+        self.assertEqual(mapping.get_mapped_value(30), 80)
+        self.assertEqual(mapping.starts, [0, 100])
+
+    def test_compose(self):
+        other_range_set = RangeSet("bar", "baz")
+        other_range_set.add_range(0, 15, 37)
+        other_range_set.add_range(37, 52, 2)
+        other_range_set.add_range(39, 0, 15)
+        mapping = PiecewiseMapping.from_range_set(self.range_set).compose(
+            PiecewiseMapping.from_range_set(other_range_set)
+        )
+        for key in range(0, 110):
+            self.assertEqual(
+                mapping.get_mapped_value(key),
+                other_range_set.get_mapped_value(self.range_set.get_mapped_value(key))
+            )
+
+
 class ParserTestCase(TestCase):
     def test_parser(self):
         input_data = StringIO("""seeds: 79 14 55 13
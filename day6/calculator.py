@@ -1,4 +1,5 @@
-from math import ceil
+from collections.abc import Iterable
+from math import ceil, isqrt
 
 
 def get_winning_products_count(time: int, distance: int) -> int:
@@ -15,3 +16,29 @@ def get_winning_products_count(time: int, distance: int) -> int:
     if midpoint % 1 == 0 and (time - midpoint) * midpoint > distance:
         count += 1
     return count
+
+
+def get_winning_products_count_closed_form(time: int, distance: int) -> int:
+    discriminant = time * time - 4 * distance
+    if discriminant <= 0:
+        return 0
+    low = max((time - isqrt(discriminant)) // 2, 1)
+    while low * (time - low) <= distance and 2 * low <= time:
+        low += 1
+    return max(time - 2 * low + 1, 0)
+
+
+def get_winning_products_counts(races: Iterable[tuple[int, int]]) -> list[int]:
+    return [get_winning_products_count_closed_form(time, distance) for time, distance in races]
+
+
+def get_product(values: Iterable[int]) -> int:
+    factors = list(values)
+    if not factors:
+        return 1
+    while len(factors) > 1:
+        paired_factors = [factors[i] * factors[i + 1] for i in range(0, len(factors) - 1, 2)]
+        if len(factors) % 2:
+            paired_factors.append(factors[-1])
+        factors = paired_factors
+    return factors[0]
@@ -1,13 +1,13 @@
 #!/usr/bin/env python
 
 import sys
-from argparse import ArgumentParser
-from functools import reduce
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from day6.calculator import get_winning_products_count
+from aoc.profiling import phase
+from day6.calculator import get_product, get_winning_products_counts
 from day6.parser import get_race_stats_from_input
 
 
@@ -21,14 +21,16 @@ parser.add_argument(
     action="store_true"
 )
 
-if __name__ == "__main__":
-    args = parser.parse_args()
-    possibilities_list = [
-        get_winning_products_count(time, distance)
-        for time, distance in get_race_stats_from_input(args.data, args.strip_spaces)
-    ]
+
+def solve(args: Namespace) -> int:
+    with phase("parse"):
+        race_stats = get_race_stats_from_input(args.data, args.strip_spaces)
+    possibilities_list = get_winning_products_counts(race_stats)
     if args.strip_spaces:
         assert len(possibilities_list) == 1
-        print(possibilities_list[0])
-    else:
-        print(reduce(lambda a, b: a * b, possibilities_list))
+        return possibilities_list[0]
+    return get_product(possibilities_list)
+
+
+if __name__ == "__main__":
+    print(solve(parser.parse_args()))
@@ -1,7 +1,13 @@
 from io import StringIO
+from math import factorial
 from unittest import TestCase
 
-from .calculator import get_winning_products_count
+from .calculator import (
+    get_product,
+    get_winning_products_count,
+    get_winning_products_count_closed_form,
+    get_winning_products_counts,
+)
 from .parser import get_race_stats_from_input
 
 
@@ -38,6 +44,38 @@ class CalculatorTestCase(TestCase):
             self._calculate_brute_force(66, 1063)
         )
 
+    def test_get_winning_products_count_closed_form(self):
+        self.assertEqual(get_winning_products_count_closed_form(7, 9), 4)
+        self.assertEqual(get_winning_products_count_closed_form(15, 40), 8)
+        self.assertEqual(get_winning_products_count_closed_form(30, 200), 9)
+        self.assertEqual(get_winning_products_count_closed_form(71530, 940200), 71503)
+        for time in range(0, 60):
+            for distance in range(0, time * time // 4 + 2):
+                self.assertEqual(
+                    get_winning_products_count_closed_form(time, distance),
+                    self._calculate_brute_force(time, distance),
+                    (time, distance)
+                )
+
+    def test_get_winning_products_count_closed_form_large_race(self):
+        time = 10 ** 30 + 7
+        distance = time * time // 4 - 10 ** 20
+        count = get_winning_products_count_closed_form(time, distance)
+        low = (time - count + 1) // 2
+        self.assertGreater(low * (time - low), distance)
+        self.assertLessEqual((low - 1) * (time - low + 1), distance)
+
+    def test_get_winning_products_counts(self):
+        races = [(7, 9), (15, 40), (30, 200), (5, 6)]
+        self.assertEqual(get_winning_products_counts(races), [4, 8, 9, 0])
+        self.assertEqual(get_winning_products_counts([]), [])
+
+    def test_get_product(self):
+        self.assertEqual(get_product([4, 8, 9]), 288)
+        self.assertEqual(get_product([]), 1)
+        self.assertEqual(get_product([3, 0, 5]), 0)
+        self.assertEqual(get_product(range(1, 1001)), factorial(1000))
+
 
 class ParserTestCase(TestCase):
     def test_parser(self):
@@ -1,11 +1,12 @@
 #!/usr/bin/env python
 
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+from aoc.profiling import phase
 from day7.parser import get_hand_collection_from_input
 
 
@@ -19,7 +20,12 @@ parser.add_argument(
     action="store_true"
 )
 
+
+def solve(args: Namespace) -> int:
+    with phase("parse"):
+        collection = get_hand_collection_from_input(args.data, args.jokers_wild)
+    return sum(collection.values)
+
+
 if __name__ == "__main__":
-    args = parser.parse_args()
-    collection = get_hand_collection_from_input(args.data, args.jokers_wild)
-    print(sum(collection.values))
+    print(solve(parser.parse_args()))
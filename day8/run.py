@@ -1,11 +1,12 @@
 #!/usr/bin/env python
 
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+from aoc.profiling import phase
 from day8.parser import get_directions_and_map_from_input
 
 
@@ -19,10 +20,14 @@ parser.add_argument(
     action="store_true"
 )
 
-if __name__ == "__main__":
-    args = parser.parse_args()
-    directions, map = get_directions_and_map_from_input(args.data)
+
+def solve(args: Namespace) -> int:
+    with phase("parse"):
+        directions, map = get_directions_and_map_from_input(args.data)
     if args.multi:
-        print(map.get_multi_step_count("A", "Z", directions))
-    else:
-        print(map.get_step_count("AAA", "ZZZ", directions))
+        return map.get_multi_step_count("A", "Z", directions)
+    return map.get_step_count("AAA", "ZZZ", directions)
+
+
+if __name__ == "__main__":
+    print(solve(parser.parse_args()))
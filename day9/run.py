@@ -1,11 +1,12 @@
 #!/usr/bin/env python
 
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
+from aoc.profiling import iter_phase
 from day9.parser import iter_sequences_from_input
 from day9.predictor import extrapolate
 
@@ -20,6 +21,12 @@ parser.add_argument(
     action="store_true"
 )
 
+
+def solve(args: Namespace) -> int:
+    return sum(
+        extrapolate(seq, args.left) for seq in iter_phase("parse", iter_sequences_from_input(args.data))
+    )
+
+
 if __name__ == "__main__":
-    args = parser.parse_args()
-    print(sum(extrapolate(seq, args.left) for seq in iter_sequences_from_input(args.data)))
+    print(solve(parser.parse_args()))